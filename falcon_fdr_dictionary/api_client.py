@@ -1,14 +1,88 @@
 """Core API client for CrowdStrike Falcon FDR."""
 
-import json
 import sys
-from typing import Dict, Any, Optional, List
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Any, Iterable, Optional, List, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from falconpy import APIHarness
 from rich.console import Console
 
+from falcon_fdr_dictionary import jsonio
+
 console = Console()
 
+# HTTP keep-alive connections kept open to the API host
+POOL_SIZE = 64
+
+# Concurrent detail fetches; must not exceed POOL_SIZE
+DEFAULT_MAX_WORKERS = 32
+
+# Upper bound on IDs sent in a single entities request
+MAX_IDS_PER_REQUEST = 100
+
+# Event IDs requested per page of the schema-events query
+PAGE_SIZE = 200
+
+# Concurrent page queries; these run alongside the detail fetches
+DEFAULT_PAGE_WORKERS = 4
+
+# (connect, read) timeouts in seconds for each HTTP request
+REQUEST_TIMEOUT = (5, 30)
+
+# Status codes retried with exponential backoff
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+# Longest pause honored from a rate limit header, in seconds
+MAX_RATE_LIMIT_WAIT = 60
+
+
+class DictionaryPages:
+    """Page results from FDRClient.iter_dictionary_pages, in offset order.
+
+    The page requests are already running in a thread pool. Closing cancels
+    the ones not yet started and shuts the pool down; this happens once the
+    last page is returned, on leaving a with block, or by calling close().
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor, pending: Iterable[Tuple[int, Future]]):
+        """Wrap page requests submitted to an executor.
+
+        Args:
+            executor: The executor the page requests were submitted to
+            pending: Tuples of (offset, future) in the order to yield them
+        """
+        self._executor = executor
+        self._pending = list(pending)
+        self._next = 0
+
+    def __iter__(self) -> "DictionaryPages":
+        return self
+
+    def __next__(self) -> Tuple[int, Dict[str, Any]]:
+        if self._next >= len(self._pending):
+            self.close()
+            raise StopIteration
+        offset, future = self._pending[self._next]
+        self._next += 1
+        return offset, future.result()
+
+    def __enter__(self) -> "DictionaryPages":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Cancel page requests that haven't started and shut down the pool."""
+        # Don't wait for pages the caller no longer wants
+        for _, future in self._pending:
+            future.cancel()
+        self._executor.shutdown()
+
 
 class FDRClient:
     """Client for interacting with CrowdStrike FDR API."""
@@ -26,7 +100,27 @@ class FDRClient:
         self.base_url = base_url
         self.falcon = None
         self.token = None
-        self.session = None
+        # Built once per token / client rather than on every API call;
+        # base_url is fixed for the life of the client
+        self._auth_headers: Dict[str, str] = {"accept": "application/json"}
+        self._base = 'https://api.crowdstrike.com' if base_url == 'auto' else base_url
+        self._page_url = f'{self._base}/fdr/queries/schema-events/v1'
+        self._items_url = f'{self._base}/fdr/entities/schema-events/v1'
+        # Created up front so worker threads share one session and its connection pool
+        self.session = self._create_session()
+        # Epoch time before which no request is sent, shared by fetch threads
+        self._rate_limit_until = 0.0
+        self._rate_limit_lock = threading.Lock()
+
+    def __enter__(self) -> "FDRClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
 
     def authenticate(self) -> bool:
         """Authenticate with CrowdStrike API.
@@ -42,6 +136,10 @@ class FDRClient:
             )
             if self.falcon.authenticate():
                 self.token = self.falcon.token
+                self._auth_headers = {
+                    "accept": "application/json",
+                    "authorization": f"bearer {self.token}",
+                }
                 return True
             return False
         except Exception as e:
@@ -54,11 +152,9 @@ class FDRClient:
         Returns:
             The base URL to use for API calls
         """
-        if self.base_url == 'auto':
-            return 'https://api.crowdstrike.com'
-        return self.base_url
+        return self._base
 
-    def get_dictionary_page(self, limit: int = 200, offset: int = 0) -> Dict[str, Any]:
+    def get_dictionary_page(self, limit: int = PAGE_SIZE, offset: int = 0) -> Dict[str, Any]:
         """Retrieve a page of FDR event dictionary resources.
 
         Args:
@@ -68,26 +164,38 @@ class FDRClient:
         Returns:
             Dictionary containing resources and pagination metadata
         """
-        headers = {
-            "accept": "application/json",
-            "authorization": f"bearer {self.token}",
-        }
-
-        base = self.get_base_url()
-        url = f'{base}/fdr/queries/schema-events/v1?limit={limit}&offset={offset}'
-
         try:
-            response = self._request(url, 'GET', headers=headers)
-            if response.status_code in [200, 201]:
-                content = json.loads(response.content.decode("utf-8"))
-                content['status_code'] = response.status_code
-                return content
-            else:
-                return self._zero_resource(response)
+            return self._get(self._page_url, {'limit': limit, 'offset': offset})
         except Exception as e:
             console.print(f"[red]Error fetching dictionary page: {e}[/red]")
             return {'status_code': 500, 'resources': [], 'errors': [str(e)]}
 
+    def iter_dictionary_pages(
+        self,
+        offsets: Iterable[int],
+        limit: int = PAGE_SIZE,
+        max_workers: int = DEFAULT_PAGE_WORKERS
+    ) -> DictionaryPages:
+        """Retrieve several pages of event IDs concurrently.
+
+        All pages are requested as soon as this is called, so they download
+        while the caller is still working on earlier results. Close the
+        result if it is not iterated to the end.
+
+        Args:
+            offsets: Starting offsets of the pages to retrieve
+            limit: Number of resources per page (default: 200)
+            max_workers: Maximum number of page requests in flight (default: 4)
+
+        Returns:
+            DictionaryPages iterating over (offset, page result) tuples in
+            the order of offsets
+        """
+        offsets = list(offsets)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = [executor.submit(self.get_dictionary_page, limit, offset) for offset in offsets]
+        return DictionaryPages(executor, zip(offsets, futures))
+
     def get_dictionary_item(self, event_id: str) -> Dict[str, Any]:
         """Retrieve a specific FDR event dictionary item.
 
@@ -97,26 +205,72 @@ class FDRClient:
         Returns:
             Dictionary containing the event schema details
         """
-        headers = {
-            "accept": "application/json",
-            "authorization": f"bearer {self.token}",
-        }
+        return self.get_dictionary_items([event_id])
 
-        base = self.get_base_url()
-        url = f'{base}/fdr/entities/schema-events/v1?ids={event_id}'
+    def get_dictionary_items(self, event_ids: List[str]) -> Dict[str, Any]:
+        """Retrieve several FDR event dictionary items in one request.
 
+        Args:
+            event_ids: The event IDs to retrieve (at most MAX_IDS_PER_REQUEST)
+
+        Returns:
+            Dictionary containing the event schema details for each ID found
+        """
         try:
-            response = self._request(url, 'GET', headers=headers)
-            if response.status_code in [200, 201]:
-                content = json.loads(response.content.decode("utf-8"))
-                content['status_code'] = response.status_code
-                return content
-            else:
-                return self._zero_resource(response)
+            # A list value is sent as repeated ids= parameters
+            return self._get(self._items_url, {'ids': event_ids})
         except Exception as e:
-            console.print(f"[red]Error fetching dictionary item {event_id}: {e}[/red]")
+            console.print(f"[red]Error fetching dictionary items {', '.join(event_ids)}: {e}[/red]")
             return {'status_code': 500, 'resources': [], 'errors': [str(e)]}
 
+    def fetch_dictionary_items(
+        self,
+        event_ids: List[str],
+        batch_size: int = MAX_IDS_PER_REQUEST,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_progress: Optional[Callable[[int], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """Retrieve schema details for many events using concurrent batched requests.
+
+        Args:
+            event_ids: The event IDs to retrieve
+            batch_size: Number of IDs per request (default: 100)
+            max_workers: Maximum number of requests in flight (default: 32)
+            on_progress: Optional callback invoked with the number of IDs completed
+
+        Returns:
+            List of event schemas, grouped in the same batch order as event_ids.
+            IDs that could not be retrieved are omitted; the status code and
+            errors of each failed batch are printed.
+        """
+        batches = [event_ids[i:i + batch_size] for i in range(0, len(event_ids), batch_size)]
+        results: List[List[Dict[str, Any]]] = [[] for _ in batches]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.get_dictionary_items, batch): index
+                for index, batch in enumerate(batches)
+            }
+            try:
+                for future in as_completed(futures):
+                    index = futures[future]
+                    result = future.result()
+                    if result.get('status_code') not in [200, 201]:
+                        console.print(
+                            f"[red]Error fetching {len(batches[index])} dictionary items "
+                            f"(HTTP {result.get('status_code')}): {result.get('errors', [])}[/red]"
+                        )
+                    results[index] = result.get('resources', [])
+                    if on_progress:
+                        on_progress(len(batches[index]))
+            except KeyboardInterrupt:
+                # Don't wait for queued requests on shutdown
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return [item for batch in results for item in batch]
+
     def validate_credentials(self) -> tuple[bool, str]:
         """Validate that credentials work and can access FDR API.
 
@@ -140,6 +294,74 @@ class FDRClient:
         except Exception as e:
             return False, f"FDR API validation error: {str(e)}"
 
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create an HTTP session with connection pooling and retries.
+
+        Returns:
+            requests.Session with a pooled, retrying adapter mounted for HTTPS
+        """
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=['GET'],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_maxsize=POOL_SIZE, max_retries=retry)
+
+        session = requests.Session()
+        session.mount('https://', adapter)
+        return session
+
+    def _wait_for_rate_limit(self) -> None:
+        """Sleep until the API rate limit window recorded by a prior response."""
+        with self._rate_limit_lock:
+            delay = self._rate_limit_until - time.time()
+        if delay > 0:
+            time.sleep(min(delay, MAX_RATE_LIMIT_WAIT))
+
+    def _update_rate_limit(self, response: requests.Response) -> None:
+        """Record a back-off window when the API reports the rate limit is used up.
+
+        Args:
+            response: The HTTP response object
+        """
+        remaining = response.headers.get('X-Ratelimit-Remaining')
+        retry_after = response.headers.get('X-Ratelimit-Retryafter')
+        if remaining is None or retry_after is None:
+            return
+
+        try:
+            if int(remaining) > 0:
+                return
+            until = float(retry_after)
+        except ValueError:
+            return
+
+        with self._rate_limit_lock:
+            self._rate_limit_until = max(self._rate_limit_until, until)
+
+    def _get(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Perform an authenticated GET request and parse the JSON response.
+
+        Args:
+            url: The endpoint URL
+            params: Query parameters
+
+        Returns:
+            Parsed response with 'status_code' added, or the error information
+            from _zero_resource() for non-200 status codes
+        """
+        response = self._request(url, 'GET', headers=self._auth_headers, params=params)
+        if response.status_code in [200, 201]:
+            content = jsonio.loads(response.content)
+            content['status_code'] = response.status_code
+            return content
+
+        return self._zero_resource(response)
+
     def _zero_resource(self, response: requests.Response) -> Dict[str, Any]:
         """Handle non-200 status codes.
 
@@ -150,7 +372,7 @@ class FDRClient:
             Dictionary with error information
         """
         try:
-            content = json.loads(response.content.decode("utf-8"))
+            content = jsonio.loads(response.content)
         except Exception:
             content = {}
 
@@ -181,22 +403,18 @@ class FDRClient:
         Returns:
             requests.Response object
         """
-        if headers is None:
-            headers = {}
+        self._wait_for_rate_limit()
 
         try:
-            prepared = requests.Request(
+            response = self.session.request(
                 method.upper(),
                 url,
                 headers=headers,
                 data=data,
-                params=params
-            ).prepare()
-
-            if self.session is None:
-                self.session = requests.Session()
-
-            response = self.session.send(prepared)
+                params=params,
+                timeout=REQUEST_TIMEOUT
+            )
+            self._update_rate_limit(response)
             return response
 
         except KeyboardInterrupt:
@@ -206,7 +424,5 @@ class FDRClient:
             # Create a mock response for error handling
             mock_response = requests.Response()
             mock_response.status_code = 500
-            mock_response._content = json.dumps({
-                'errors': [str(e)]
-            }).encode('utf-8')
+            mock_response._content = jsonio.dumps_line({'errors': [str(e)]})
             return mock_response
@@ -1,9 +1,9 @@
 """CLI interface for Falcon FDR Dictionary using Click."""
 
-import json
 import logging
 import os
 import sys
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
@@ -13,10 +13,12 @@ from rich.logging import RichHandler
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
 from rich.table import Table
+from rich.text import Text
 
-from falcon_fdr_dictionary.config import Config, get_config
-from falcon_fdr_dictionary.api_client import FDRClient
-from falcon_fdr_dictionary.tagging import tag_dictionary
+from falcon_fdr_dictionary import jsonio
+from falcon_fdr_dictionary.config import CLOUD_REGIONS, Config, get_config, resolve_tag_workers
+from falcon_fdr_dictionary.api_client import FDRClient, MAX_IDS_PER_REQUEST, PAGE_SIZE
+from falcon_fdr_dictionary.tagging import get_keywords, tag_events
 
 VERSION = "2.0.0"
 console = Console()
@@ -30,14 +32,17 @@ BANNER = r"""
 Falcon FDR Event Dictionary v{version}
 """
 
+# Built once so printing the banner needs no formatting or markup parsing
+_BANNER_TEXT = Text(BANNER.format(version=VERSION), style="bold cyan")
+
 
 class BannerGroup(click.Group):
     """Custom Click Group that displays banner before help."""
 
     def get_help(self, ctx):
         """Get help with banner."""
-        config = Config.from_env() if Path('.env').exists() else None
-        print_banner(config, force=True)
+        # Help always shows the banner, so there is no config to load
+        print_banner(force=True)
         return super().get_help(ctx)
 
 
@@ -53,7 +58,7 @@ def print_banner(config: Optional[Config] = None, force: bool = False) -> None:
         show = config.show_banner
 
     if show:
-        console.print(BANNER.format(version=VERSION), style="bold cyan", highlight=False)
+        console.print(_BANNER_TEXT, highlight=False)
 
 
 def setup_logging(log_level: str, log_file: str, verbose: bool) -> None:
@@ -107,7 +112,7 @@ def cli(ctx):
     '--cloud',
     envvar='FALCON_CLIENT_CLOUD',
     default='auto',
-    type=click.Choice(['auto', 'us1', 'us2', 'eu1', 'usgov1', 'usgov2']),
+    type=click.Choice(CLOUD_REGIONS),
     help='CrowdStrike cloud region (env: FALCON_CLIENT_CLOUD)'
 )
 @click.option(
@@ -115,6 +120,17 @@ def cli(ctx):
     help='Output file path (default: fdr-event-dictionary.json)',
     type=click.Path()
 )
+@click.option(
+    '-b', '--batch-size',
+    type=click.IntRange(min=1, max=MAX_IDS_PER_REQUEST),
+    default=MAX_IDS_PER_REQUEST,
+    help=f'Event IDs fetched per request (default: {MAX_IDS_PER_REQUEST})'
+)
+@click.option(
+    '--pretty/--compact',
+    default=False,
+    help='Indent the output and sort keys (default: compact)'
+)
 @click.option(
     '-v', '--verbose',
     is_flag=True,
@@ -125,6 +141,8 @@ def generate(
     client_secret: Optional[str],
     cloud: Optional[str],
     output: Optional[str],
+    batch_size: int,
+    pretty: bool,
     verbose: bool
 ):
     """Generate FDR event dictionary from CrowdStrike API.
@@ -156,6 +174,7 @@ def generate(
     logger.info("Starting FDR Event Dictionary Generation")
     logger.info(f"Cloud region: {config.falcon_client_cloud}")
     logger.info(f"Log level: {config.log_level}")
+    logger.info(f"Batch size: {batch_size}")
 
     # Display banner
     print_banner(config)
@@ -197,15 +216,17 @@ def generate(
     logger.info("Authentication successful")
     console.print("[green]✓ Authentication successful[/green]\n")
 
-    # Fetch dictionary
-    complete_dictionary = []
+    # Fetch dictionary. Event schemas are spooled to a JSON Lines file as they
+    # arrive and only loaded back for the final sort and write.
+    spool_file = Path(f"{output_file}.part.jsonl")
     total = 1
-    current_offset = 0
+    skipped = 0
+    pages = None
 
     try:
         # First request to get total count
         logger.info("Fetching initial page to determine total event count...")
-        initial_result = client.get_dictionary_page(limit=200, offset=0)
+        initial_result = client.get_dictionary_page(limit=PAGE_SIZE, offset=0)
         if initial_result.get('status_code') not in [200, 201]:
             errors = initial_result.get('errors', [])
             logger.error(f"Error fetching dictionary: {errors}")
@@ -216,50 +237,68 @@ def generate(
         logger.info(f"Total events to fetch: {total}")
         console.print(f"[bold]Fetching {total:,} events...[/bold]\n")
 
-        with Progress(
+        with open(spool_file, 'wb') as spool, Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TextColumn("({task.completed}/{task.total})"),
             TimeRemainingColumn(),
-            console=console
+            console=console,
+            # Redraws happen on a timer, not per update; a few a second is plenty
+            refresh_per_second=4
         ) as progress:
             task = progress.add_task("[cyan]Fetching event details...", total=total)
 
-            # Process first batch
-            for resource_id in initial_result.get('resources', []):
-                item = client.get_dictionary_item(resource_id)
-                if item.get('resources'):
-                    complete_dictionary.append(item['resources'][0])
-                progress.update(task, advance=1)
+            def advance(count: int) -> None:
+                progress.update(task, advance=count)
 
-            current_offset = len(initial_result.get('resources', []))
+            def spool_items(items: list) -> None:
+                """Spool event schemas, dropping any without an ID to sort by."""
+                nonlocal skipped
+                for item in items:
+                    if item.get('id') is None:
+                        skipped += 1
+                        continue
+                    spool.write(jsonio.dumps_line(item))
 
-            # Fetch remaining pages
-            while current_offset < total:
-                page_result = client.get_dictionary_page(limit=200, offset=current_offset)
+            # The total is known, so request every remaining page now; they
+            # download while the first page's details are being fetched
+            offsets = range(len(initial_result.get('resources', [])), total, PAGE_SIZE)
+            pages = client.iter_dictionary_pages(offsets)
+
+            # Process first batch
+            items = client.fetch_dictionary_items(
+                initial_result.get('resources', []), batch_size=batch_size, on_progress=advance
+            )
+            spool_items(items)
+
+            for current_offset, page_result in pages:
                 if page_result.get('status_code') not in [200, 201]:
                     logger.error(f"Error at offset {current_offset}")
                     console.print(f"[red]✗ Error at offset {current_offset}[/red]")
                     break
 
-                for resource_id in page_result.get('resources', []):
-                    item = client.get_dictionary_item(resource_id)
-                    if item.get('resources'):
-                        complete_dictionary.append(item['resources'][0])
-                    progress.update(task, advance=1)
+                items = client.fetch_dictionary_items(
+                    page_result.get('resources', []), batch_size=batch_size, on_progress=advance
+                )
+                spool_items(items)
 
-                current_offset += len(page_result.get('resources', []))
+        if skipped:
+            logger.warning(f"Skipped {skipped} event schemas without an ID")
+            console.print(f"[yellow]⚠ Skipped {skipped} event schemas without an ID[/yellow]")
+
+        with open(spool_file, 'rb') as spool:
+            complete_dictionary = [jsonio.loads(line) for line in spool]
 
         # Sort by ID
         logger.info(f"Sorting {len(complete_dictionary)} events by ID...")
-        complete_dictionary = sorted(complete_dictionary, key=lambda k: k.get('id', 0))
+        complete_dictionary.sort(key=itemgetter('id'))
 
         # Write to file
         logger.info(f"Writing {len(complete_dictionary)} events to {output_file}...")
-        with open(output_file, 'w', encoding='utf-8') as outfile:
-            json.dump(complete_dictionary, outfile, indent=4, sort_keys=True)
+        with open(output_file, 'wb') as outfile:
+            outfile.write(jsonio.dumps(complete_dictionary, pretty))
 
         logger.info(f"Successfully generated dictionary with {len(complete_dictionary)} events")
         logger.info(f"Output saved to: {output_file}")
@@ -267,6 +306,12 @@ def generate(
         console.print(f"\n[bold green]✓ Successfully generated dictionary[/bold green]")
         console.print(f"[green]Saved {len(complete_dictionary)} events to: {output_file}[/green]")
 
+        # Pages or batches that failed leave events out of the dictionary
+        missing = total - len(complete_dictionary)
+        if missing > 0:
+            logger.warning(f"{missing} of {total} events could not be retrieved")
+            console.print(f"[yellow]⚠ {missing} of {total} events could not be retrieved[/yellow]")
+
     except KeyboardInterrupt:
         logger.warning("Generation interrupted by user")
         console.print("\n[yellow]Generation interrupted by user[/yellow]")
@@ -275,6 +320,13 @@ def generate(
         logger.exception("Error during generation")
         console.print(f"[red]Error: {e}[/red]")
         sys.exit(1)
+    finally:
+        # Stop page requests still queued if the run ended early
+        if pages is not None:
+            pages.close()
+        client.close()
+        if spool_file.exists():
+            spool_file.unlink()
 
 
 @cli.command()
@@ -286,12 +338,29 @@ def generate(
     type=click.Path(exists=True),
     help='Custom tag files to use (can be specified multiple times)'
 )
+@click.option(
+    '-j', '--jobs',
+    type=click.IntRange(min=0),
+    help='Worker processes used for tagging, 0 for one per CPU (default: TAG_WORKERS or 1)'
+)
+@click.option(
+    '--pretty/--compact',
+    default=True,
+    help='Indent the output and sort keys (default: pretty)'
+)
 @click.option(
     '-v', '--verbose',
     is_flag=True,
     help='Enable verbose output'
 )
-def tag(input_file: str, output_file: str, tag_files: tuple, verbose: bool):
+def tag(
+    input_file: str,
+    output_file: str,
+    tag_files: tuple,
+    jobs: Optional[int],
+    pretty: bool,
+    verbose: bool
+):
     """Tag FDR event dictionary with keywords and expanded names.
 
     Reads a JSON dictionary file, adds 'name_expanded' and 'tags' fields
@@ -304,6 +373,7 @@ def tag(input_file: str, output_file: str, tag_files: tuple, verbose: bool):
       falcon-fdr-events-dictionary tag dict.json tagged.json -v
       falcon-fdr-events-dictionary tag input.json output.json -t custom_tags.yaml
       falcon-fdr-events-dictionary tag input.json output.json -t tags1.yaml -t tags2.yaml
+      falcon-fdr-events-dictionary tag input.json output.json -j 8
     """
     # Try to load config for logging settings and tag files
     try:
@@ -313,11 +383,13 @@ def tag(input_file: str, output_file: str, tag_files: tuple, verbose: bool):
         log_file = config.log_file
         # Use CLI tag files if provided, otherwise use config
         tag_files_list = list(tag_files) if tag_files else config.tag_files
+        workers = resolve_tag_workers(jobs) if jobs is not None else config.tag_workers
     except ValueError:
         show_banner_flag = True
         log_level = "INFO"
         log_file = "falcon_fdr_dictionary.log"
         tag_files_list = list(tag_files) if tag_files else None
+        workers = resolve_tag_workers(jobs) if jobs is not None else 1
 
     # Setup logging
     setup_logging(log_level, log_file, verbose)
@@ -327,6 +399,7 @@ def tag(input_file: str, output_file: str, tag_files: tuple, verbose: bool):
     logger.info("Starting FDR Event Dictionary Tagging")
     logger.info(f"Input file: {input_file}")
     logger.info(f"Output file: {output_file}")
+    logger.info(f"Tag workers: {workers}")
     if tag_files_list:
         logger.info(f"Tag files: {', '.join(tag_files_list)}")
         console.print(f"[cyan]Tag files: {', '.join(tag_files_list)}[/cyan]")
@@ -335,40 +408,48 @@ def tag(input_file: str, output_file: str, tag_files: tuple, verbose: bool):
         console.print("[cyan]Tag files: Using default tags[/cyan]")
     console.print()
 
-    try:
-        # Read input file
-        logger.info(f"Reading dictionary from {input_file}...")
-        with console.status("[yellow]Reading dictionary...[/yellow]"):
-            with open(input_file, 'r', encoding='utf-8') as f:
-                events = json.load(f)
-
-        logger.info(f"Loaded {len(events)} events")
-        console.print(f"[green]✓ Loaded {len(events)} events[/green]\n")
+    # Events are streamed into a file next to the output and moved over it
+    # once complete, so the input can be tagged onto itself and a failure
+    # never leaves a truncated output behind
+    part_file = Path(f"{output_file}.part")
 
-        # Tag events
-        logger.info("Tagging events with keywords...")
+    try:
+        keywords = get_keywords(tag_files_list)
+        # Count events with no tags, keeping only the ones that get listed
+        untagged_count = 0
+        untagged_events = []
+
+        def tagged_events():
+            """Tag events as they are read from the input file."""
+            nonlocal untagged_count
+            for tagged_event in tag_events(jsonio.iter_array(input_file), keywords, workers):
+                # Track events with no tags
+                if not tagged_event['tags']:
+                    untagged_count += 1
+                    if len(untagged_events) < 10:
+                        untagged_events.append(tagged_event)
+                yield tagged_event
+
+        # Stream events from the input file through tagging into the output file
+        logger.info(f"Tagging events from {input_file} with keywords...")
         with console.status("[yellow]Tagging events...[/yellow]"):
-            tagged_events, untagged_events = tag_dictionary(events, tag_files_list)
-
-        # Write output
-        logger.info(f"Writing {len(tagged_events)} tagged events to {output_file}...")
-        with console.status("[yellow]Writing output...[/yellow]"):
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(tagged_events, f, indent=4, sort_keys=True)
+            with open(part_file, 'wb') as f:
+                tagged_count = jsonio.write_array(f, tagged_events(), pretty)
+            os.replace(part_file, output_file)
 
-        logger.info(f"Successfully tagged {len(tagged_events)} events")
-        logger.info(f"Events with no tags: {len(untagged_events)}")
+        logger.info(f"Successfully tagged {tagged_count} events")
+        logger.info(f"Events with no tags: {untagged_count}")
         console.print(f"[bold green]✓ Successfully tagged dictionary[/bold green]")
-        console.print(f"[green]Saved {len(tagged_events)} events to: {output_file}[/green]")
+        console.print(f"[green]Saved {tagged_count} events to: {output_file}[/green]")
 
         # Report untagged events
-        if untagged_events:
-            logger.warning(f"{len(untagged_events)} events with no tags found")
-            console.print(f"\n[yellow]⚠ {len(untagged_events)} events with no tags found:[/yellow]")
-            for event in untagged_events[:10]:  # Show first 10
+        if untagged_count:
+            logger.warning(f"{untagged_count} events with no tags found")
+            console.print(f"\n[yellow]⚠ {untagged_count} events with no tags found:[/yellow]")
+            for event in untagged_events:  # Show first 10
                 console.print(f"  • ({event['id']}) {event.get('name_expanded', event['name'])}")
-            if len(untagged_events) > 10:
-                console.print(f"  ... and {len(untagged_events) - 10} more")
+            if untagged_count > 10:
+                console.print(f"  ... and {untagged_count - 10} more")
         else:
             logger.info("All events successfully tagged")
             console.print("\n[green]✓ All events successfully tagged[/green]")
@@ -379,7 +460,7 @@ def tag(input_file: str, output_file: str, tag_files: tuple, verbose: bool):
         logger.error(f"Input file not found: {input_file}")
         console.print(f"[red]✗ Error: Input file not found: {input_file}[/red]")
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except jsonio.DECODE_ERRORS as e:
         logger.error(f"Invalid JSON in input file: {e}")
         console.print(f"[red]✗ Error: Invalid JSON in input file: {e}[/red]")
         sys.exit(1)
@@ -391,6 +472,9 @@ def tag(input_file: str, output_file: str, tag_files: tuple, verbose: bool):
         logger.exception("Error during tagging")
         console.print(f"[red]Error: {e}[/red]")
         sys.exit(1)
+    finally:
+        if part_file.exists():
+            part_file.unlink()
 
 
 @cli.command()
@@ -408,7 +492,7 @@ def tag(input_file: str, output_file: str, tag_files: tuple, verbose: bool):
     '--cloud',
     envvar='FALCON_CLIENT_CLOUD',
     default='auto',
-    type=click.Choice(['auto', 'us1', 'us2', 'eu1', 'usgov1', 'usgov2']),
+    type=click.Choice(CLOUD_REGIONS),
     help='CrowdStrike cloud region (env: FALCON_CLIENT_CLOUD)'
 )
 def validate(
@@ -458,16 +542,15 @@ def validate(
     console.print(f"[cyan]Cloud Region: {config.falcon_client_cloud}[/cyan]\n")
 
     # Create client
-    client = FDRClient(
+    with FDRClient(
         config.falcon_client_id,
         config.falcon_client_secret,
         config.falcon_client_cloud
-    )
-
-    # Validate credentials
-    logger.info("Validating API credentials...")
-    with console.status("[yellow]Validating credentials...[/yellow]"):
-        success, message = client.validate_credentials()
+    ) as client:
+        # Validate credentials
+        logger.info("Validating API credentials...")
+        with console.status("[yellow]Validating credentials...[/yellow]"):
+            success, message = client.validate_credentials()
 
     if success:
         logger.info(f"Validation successful: {message}")
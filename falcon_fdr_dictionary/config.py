@@ -2,8 +2,13 @@
 
 import os
 from dataclasses import dataclass
-from typing import Optional
-from dotenv import load_dotenv
+from functools import lru_cache
+from typing import Dict, Optional
+from dotenv import dotenv_values, find_dotenv
+
+# Supported CrowdStrike cloud regions, in the order shown to users
+CLOUD_REGIONS = ('auto', 'us1', 'us2', 'eu1', 'usgov1', 'usgov2')
+_VALID_REGIONS = frozenset(CLOUD_REGIONS)
 
 
 @dataclass
@@ -22,6 +27,9 @@ class Config:
     # Tag file settings
     tag_files: Optional[list] = None  # List of tag file paths, None = use default
 
+    # Worker processes used by the tag command
+    tag_workers: int = 1
+
     # Logging
     log_level: str = "INFO"
     log_file: str = "falcon_fdr_dictionary.log"
@@ -42,16 +50,13 @@ class Config:
         Raises:
             ValueError: If required credentials are missing
         """
-        # Load .env file if it exists
-        if env_file:
-            load_dotenv(env_file)
-        else:
-            load_dotenv()
+        # Variables already set in the environment take precedence over .env
+        env = {**_load_env_file(env_file), **os.environ}
 
         # Use FALCON_ prefix for API credentials
         env_prefix = "FALCON_"
-        client_id = os.getenv(f"{env_prefix}CLIENT_ID")
-        client_secret = os.getenv(f"{env_prefix}CLIENT_SECRET")
+        client_id = env.get(f"{env_prefix}CLIENT_ID")
+        client_secret = env.get(f"{env_prefix}CLIENT_SECRET")
 
         # Validate required credentials
         if not client_id or not client_secret:
@@ -63,13 +68,14 @@ class Config:
         return cls(
             falcon_client_id=client_id,
             falcon_client_secret=client_secret,
-            falcon_client_cloud=os.getenv(f"{env_prefix}CLIENT_CLOUD", "auto"),
-            output_dir=os.getenv("OUTPUT_DIR", "./docs"),
-            default_output_file=os.getenv("DEFAULT_OUTPUT_FILE", "fdr-event-dictionary.json"),
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
-            log_file=os.getenv("LOG_FILE", "falcon_fdr_dictionary.log"),
-            show_banner=os.getenv("SHOW_BANNER", "true").lower() in ["true", "1", "yes"],
-            tag_files=cls._parse_tag_files(os.getenv("TAG_FILES")),
+            falcon_client_cloud=env.get(f"{env_prefix}CLIENT_CLOUD", "auto"),
+            output_dir=env.get("OUTPUT_DIR", "./docs"),
+            default_output_file=env.get("DEFAULT_OUTPUT_FILE", "fdr-event-dictionary.json"),
+            log_level=env.get("LOG_LEVEL", "INFO"),
+            log_file=env.get("LOG_FILE", "falcon_fdr_dictionary.log"),
+            show_banner=env.get("SHOW_BANNER", "true").lower() in ["true", "1", "yes"],
+            tag_files=cls._parse_tag_files(env.get("TAG_FILES")),
+            tag_workers=cls._parse_tag_workers(env.get("TAG_WORKERS")),
         )
 
     @staticmethod
@@ -89,14 +95,77 @@ class Config:
         files = [f.strip() for f in tag_files_str.split(",") if f.strip()]
         return files if files else None
 
+    @staticmethod
+    def _parse_tag_workers(tag_workers_str: Optional[str]) -> int:
+        """Parse TAG_WORKERS environment variable.
+
+        Args:
+            tag_workers_str: Number of worker processes, or 0 for one per CPU
+
+        Returns:
+            Number of worker processes, at least 1
+        """
+        try:
+            workers = int(tag_workers_str or 1)
+        except ValueError:
+            return 1
+
+        return resolve_tag_workers(workers)
+
     def validate_cloud_region(self) -> bool:
         """Validate that the cloud region is supported.
 
         Returns:
             True if valid, False otherwise
         """
-        valid_regions = ['auto', 'us1', 'us2', 'eu1', 'usgov1', 'usgov2']
-        return self.falcon_client_cloud in valid_regions
+        return self.falcon_client_cloud in _VALID_REGIONS
+
+
+def resolve_tag_workers(workers: int) -> int:
+    """Turn a tag worker setting into a number of worker processes.
+
+    Args:
+        workers: Number of worker processes, or 0 for one per CPU
+
+    Returns:
+        Number of worker processes, at least 1
+    """
+    if workers == 0:
+        return os.cpu_count() or 1
+    return max(workers, 1)
+
+
+def _load_env_file(env_file: Optional[str] = None) -> Dict[str, str]:
+    """Read variables from a .env file without touching os.environ.
+
+    Args:
+        env_file: Optional path to .env file (default: nearest .env found by
+            python-dotenv)
+
+    Returns:
+        Dictionary of variables set in the file, empty if there is no file
+    """
+    path = env_file or find_dotenv()
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}
+
+    return _read_env_file(path, mtime)
+
+
+@lru_cache(maxsize=4)
+def _read_env_file(path: str, mtime_ns: int) -> Dict[str, str]:
+    """Parse a .env file, cached until the file changes.
+
+    Args:
+        path: Path to the .env file
+        mtime_ns: Modification time of the file, part of the cache key
+
+    Returns:
+        Dictionary of variables that have a value in the file
+    """
+    return {key: value for key, value in dotenv_values(path).items() if value is not None}
 
 
 def get_config(
@@ -0,0 +1,133 @@
+"""JSON encoding and decoding for API responses and dictionary files.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Both paths produce the same output layout. Dictionary files
+are streamed with ijson when it is installed.
+"""
+
+import json
+from itertools import chain
+from typing import Any, BinaryIO, Iterable, Iterator, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+# Every error raised for malformed input, including while streaming
+DECODE_ERRORS = (JSONDecodeError, ijson.JSONError) if ijson is not None else (JSONDecodeError,)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON document as UTF-8 bytes or str
+
+    Returns:
+        The parsed Python object
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = True) -> bytes:
+    """Serialize an object to JSON.
+
+    Args:
+        obj: The object to serialize
+        pretty: Indent by two spaces and sort keys; otherwise write compact
+            JSON with keys in insertion order (default: True)
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps_line(obj: Any) -> bytes:
+    """Serialize an object as one compact JSON Lines record.
+
+    Args:
+        obj: The object to serialize
+
+    Returns:
+        UTF-8 encoded JSON document followed by a newline
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def iter_array(path: str) -> Iterator[Any]:
+    """Iterate over the items of a file containing a top-level JSON array.
+
+    Items are streamed with ijson when it is installed, so the whole
+    document is never held in memory. Otherwise the file is parsed at once.
+
+    Args:
+        path: Path to the JSON file
+
+    Yields:
+        Each item of the array
+
+    Raises:
+        DECODE_ERRORS: If the file is not valid JSON or its top-level value
+            is not an array
+    """
+    with open(path, 'rb') as f:
+        if ijson is not None:
+            events = ijson.parse(f, use_float=True)
+            first = next(events, None)
+            # ijson.items yields nothing for any other top-level value
+            if first is None or first[:2] != ('', 'start_array'):
+                raise JSONDecodeError("Expected a top-level JSON array", "", 0)
+            yield from ijson.items(chain([first], events), 'item')
+        else:
+            data = loads(f.read())
+            if not isinstance(data, list):
+                raise JSONDecodeError("Expected a top-level JSON array", "", 0)
+            yield from data
+
+
+def write_array(file: BinaryIO, items: Iterable[Any], pretty: bool = True) -> int:
+    """Write items to a file as a JSON array, one item at a time.
+
+    The output is byte-identical to dumps(list(items), pretty).
+
+    Args:
+        file: Binary file object to write to
+        items: Objects to serialize as array items
+        pretty: Indent by two spaces and sort keys (default: True)
+
+    Returns:
+        Number of items written
+    """
+    opening, separator, closing = (b"[\n  ", b",\n  ", b"\n]") if pretty else (b"[", b",", b"]")
+
+    count = 0
+    for item in items:
+        file.write(opening if count == 0 else separator)
+        data = dumps(item, pretty)
+        # Encoded JSON never contains raw newlines inside strings
+        file.write(data.replace(b"\n", b"\n  ") if pretty else data)
+        count += 1
+
+    file.write(closing if count else b"[]")
+    return count
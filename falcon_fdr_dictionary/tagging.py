@@ -2,15 +2,68 @@
 
 import os
 import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterable, Iterator, List, Deque, Dict, Any, FrozenSet, Optional, Set, Tuple, Union
 import yaml
 from rich.console import Console
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:  # pragma: no cover - optional dependency
+    re2 = None
+
 console = Console()
 
-# Global keyword cache
-_KEYWORDS_CACHE: Optional[Dict[str, List[str]]] = None
+# Path of the default tags file, kept as a string for cache keys
+_DEFAULT_TAGS_FILE = str(Path(__file__).parent / "tags" / "default_tags.yaml")
+
+# Default keyword dictionary last returned by get_keywords, used when no
+# keywords are passed in so tagging doesn't stat the tag file on every call
+_DEFAULT_KEYWORDS: Optional[Dict[str, List[str]]] = None
+
+# Keyword dictionaries by the tag files they were loaded from and those
+# files' modification times, so edited files are picked up again
+_KEYWORDS_CACHE: Dict[Tuple[Tuple[str, Optional[int]], ...], Dict[str, List[str]]] = {}
+
+# Word starts inside a CamelCase name: a capital followed by a lowercase letter.
+# Runs of capitals ("HTTP" in "HTTPConnection") stay together.
+_CAMEL_CASE_BOUNDARY = re.compile(r'(?=[A-Z][a-z])')
+
+# A run of word characters, as delimited by regex \b
+_WORD_TOKEN = re.compile(r'\w+')
+
+# Compiled matchers by id() of the keyword dictionary they were built from.
+# Each entry holds on to its dictionary so the id can't be reused.
+_MATCHER_CACHE: Dict[int, Tuple[Dict[str, List[str]], "KeywordMatcher"]] = {}
+
+# Keyword dictionaries to keep compiled matchers for
+MATCHER_CACHE_SIZE = 4
+
+# Texts per matcher whose matching tags are remembered
+MATCH_CACHE_SIZE = 4096
+
+# Events sent to a worker process at a time when tagging in parallel
+PARALLEL_CHUNK_SIZE = 64
+
+# Chunks queued per worker process, bounding how far input is read ahead
+PARALLEL_CHUNKS_PER_WORKER = 2
+
+# Keyword dictionary of a tagging worker process, set by _init_worker
+_WORKER_KEYWORDS: Optional[Union[Dict[str, List[str]], "KeywordMatcher"]] = None
 
 
 def get_default_tags_file() -> Path:
@@ -19,7 +72,7 @@ def get_default_tags_file() -> Path:
     Returns:
         Path to default_tags.yaml
     """
-    return Path(__file__).parent / "tags" / "default_tags.yaml"
+    return Path(_DEFAULT_TAGS_FILE)
 
 
 def load_tag_files(tag_files: Optional[List[str]] = None) -> Dict[str, List[str]]:
@@ -35,11 +88,12 @@ def load_tag_files(tag_files: Optional[List[str]] = None) -> Dict[str, List[str]
         FileNotFoundError: If a tag file doesn't exist
         yaml.YAMLError: If a tag file has invalid YAML
     """
-    keywords: Dict[str, List[str]] = {}
+    # Keywords per tag as dict keys: deduplicated, in first-seen order
+    keywords: Dict[str, Dict[str, None]] = {}
 
     # If no files specified, use default
     if not tag_files:
-        tag_files = [str(get_default_tags_file())]
+        tag_files = [_DEFAULT_TAGS_FILE]
 
     for tag_file_path in tag_files:
         tag_path = Path(tag_file_path)
@@ -49,8 +103,7 @@ def load_tag_files(tag_files: Optional[List[str]] = None) -> Dict[str, List[str]
             continue
 
         try:
-            with open(tag_path, 'r', encoding='utf-8') as f:
-                file_keywords = yaml.safe_load(f)
+            file_keywords = _parse_tag_file(str(tag_path), tag_path.stat().st_mtime_ns)
 
             if not file_keywords:
                 console.print(f"[yellow]Warning: Empty tag file: {tag_file_path}[/yellow]")
@@ -63,16 +116,39 @@ def load_tag_files(tag_files: Optional[List[str]] = None) -> Dict[str, List[str]
                     console.print(f"[yellow]Warning: Skipping invalid tag entry in {tag_file_path}[/yellow]")
                     continue
 
+                # Tag names end up in sorted tag lists, so they must be strings
+                if not isinstance(tag, str):
+                    console.print(f"[yellow]Warning: Tag name {tag!r} in {tag_file_path} is not a string, skipping[/yellow]")
+                    continue
+
                 # Ensure words is a list
                 if not isinstance(words, list):
                     console.print(f"[yellow]Warning: Tag '{tag}' in {tag_file_path} has invalid format, skipping[/yellow]")
                     continue
 
-                if tag in keywords:
-                    # Merge and deduplicate keywords for existing tag
-                    keywords[tag] = list(set(keywords[tag] + words))
-                else:
-                    keywords[tag] = words
+                # Unquoted numbers and booleans in YAML are not keywords
+                if not all(isinstance(word, str) for word in words):
+                    console.print(
+                        f"[yellow]Warning: Tag '{tag}' in {tag_file_path} has non-string keywords, "
+                        f"ignoring them (quote them to use them)[/yellow]"
+                    )
+                    words = [word for word in words if isinstance(word, str)]
+
+                # Blank keywords would match almost any text
+                if not all(word.strip() for word in words):
+                    console.print(
+                        f"[yellow]Warning: Tag '{tag}' in {tag_file_path} has blank keywords, "
+                        f"ignoring them[/yellow]"
+                    )
+                    words = [word for word in words if word.strip()]
+
+                # Matching ignores case, so keywords are kept in lowercase
+                words = [word.lower() for word in words]
+                if len(set(words)) < len(words):
+                    console.print(f"[yellow]Warning: Tag '{tag}' in {tag_file_path} lists duplicate keywords[/yellow]")
+
+                # Merge and deduplicate keywords for existing tag
+                keywords.setdefault(tag, {}).update(dict.fromkeys(words))
 
         except yaml.YAMLError as e:
             console.print(f"[red]Error parsing tag file {tag_file_path}: {e}[/red]")
@@ -81,12 +157,33 @@ def load_tag_files(tag_files: Optional[List[str]] = None) -> Dict[str, List[str]
             console.print(f"[red]Error loading tag file {tag_file_path}: {e}[/red]")
             raise
 
-    return keywords
+    return {tag: list(words) for tag, words in keywords.items()}
+
+
+@lru_cache(maxsize=32)
+def _parse_tag_file(path: str, mtime_ns: int) -> Any:
+    """Parse a tag YAML file, cached until the file changes.
+
+    The parsed document is shared between calls and must not be modified.
+
+    Args:
+        path: Path to the tag YAML file
+        mtime_ns: Modification time of the file, part of the cache key
+
+    Returns:
+        The parsed YAML document
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=SafeLoader)
 
 
 def get_keywords(tag_files: Optional[List[str]] = None, force_reload: bool = False) -> Dict[str, List[str]]:
     """Get keyword mappings, using cache if available.
 
+    The returned dictionary is shared by every caller and has a matcher
+    compiled for it on first use, so it must not be modified; copy it to
+    build a customized set of keywords.
+
     Args:
         tag_files: List of paths to tag YAML files. If None, uses default.
         force_reload: Force reload even if cached
@@ -94,130 +191,523 @@ def get_keywords(tag_files: Optional[List[str]] = None, force_reload: bool = Fal
     Returns:
         Dictionary mapping tag names to keyword lists
     """
-    global _KEYWORDS_CACHE
+    global _DEFAULT_KEYWORDS
+
+    key = _tag_files_key(tag_files)
 
     # Use cache if available and not forcing reload
-    if _KEYWORDS_CACHE is not None and not force_reload and not tag_files:
-        return _KEYWORDS_CACHE
+    if key in _KEYWORDS_CACHE and not force_reload:
+        keywords = _KEYWORDS_CACHE[key]
+        if not tag_files:
+            _DEFAULT_KEYWORDS = keywords
+        return keywords
+
+    # Forget the old keyword dictionaries; matchers for unchanged keywords
+    # are still found by their contents. Parsed files are dropped too, since
+    # an edit can keep the modification time on coarse-grained filesystems.
+    if force_reload:
+        _MATCHER_CACHE.clear()
+        _parse_tag_file.cache_clear()
 
     # Load from files
     keywords = load_tag_files(tag_files)
-
-    # Cache default keywords
+    _KEYWORDS_CACHE[key] = keywords
     if not tag_files:
-        _KEYWORDS_CACHE = keywords
+        _DEFAULT_KEYWORDS = keywords
 
     return keywords
 
 
-def extract_tags(description: str, keywords: Optional[Dict[str, List[str]]] = None) -> List[str]:
-    """Extract tags from a description based on keyword matching.
+def _default_keywords() -> Dict[str, List[str]]:
+    """Get the default keywords without checking the tag file for changes.
+
+    The default tags file is loaded on first use. It is only checked for
+    changes again when get_keywords() is called, as the CLI does once per run.
+
+    Returns:
+        Dictionary mapping tag names to keyword lists
+    """
+    if _DEFAULT_KEYWORDS is None:
+        return get_keywords()
+    return _DEFAULT_KEYWORDS
+
+
+def _tag_files_key(tag_files: Optional[List[str]]) -> Tuple[Tuple[str, Optional[int]], ...]:
+    """Build the keyword cache key for a list of tag files.
 
     Args:
-        description: The text to extract tags from
-        keywords: Optional keyword dictionary. If None, uses default.
+        tag_files: List of paths to tag YAML files. If None, uses default.
 
     Returns:
-        List of matching tag names
+        Tuple of (path, modification time in ns) pairs; the time is None for
+        files that can't be read
+    """
+    if not tag_files:
+        tag_files = [_DEFAULT_TAGS_FILE]
+
+    key = []
+    for tag_file_path in tag_files:
+        try:
+            mtime = os.stat(tag_file_path).st_mtime_ns
+        except OSError:
+            mtime = None
+        key.append((str(tag_file_path), mtime))
+
+    return tuple(key)
+
+
+def _is_word_char(char: str) -> bool:
+    """Check whether a character counts as a word character for regex \\b."""
+    return char.isalnum() or char == '_'
+
+
+class KeywordMatcher:
+    """Matches text against every tag's keywords in a single pass.
+
+    With pyahocorasick installed, keywords are loaded into an Aho-Corasick
+    automaton that reports every keyword occurrence in one linear scan;
+    regex word boundaries are then checked on each hit.
+
+    Otherwise ASCII text is split into runs of word characters once, and
+    keywords that are a single such run are looked up directly in an index.
+    Longer keywords are prefiltered with plain substring checks on the
+    lowercased text, and only those found that way are confirmed with
+    \\b-bounded regexes.
+
+    Any other text, with google-re2 installed, goes through an RE2 set of
+    all keywords that reports, in one linear-time DFA pass, which of them
+    occur anywhere in the text. Only those few are then checked for word
+    boundaries with re, since RE2's \\b only knows ASCII word characters.
+    Without google-re2 it is scanned with all keywords fused into one
+    case-insensitive regex alternation, longest first, behind a zero-width
+    lookahead so that hits at every start position are found. A hit on a
+    keyword also implies hits on any other keyword that is a word-bounded
+    prefix of it ("address" in "address space"), so those tags are folded
+    into the longer keyword's tag set.
+
+    Either way the result is the same as testing each tag's keywords
+    separately with a \\b-delimited, case-insensitive regex. Results are
+    remembered for up to MATCH_CACHE_SIZE texts at a time, since many events
+    share a description.
     """
-    if keywords is None:
-        keywords = get_keywords()
 
-    matching_tags = []
+    def __init__(self, keywords: Dict[str, List[str]]):
+        """Compile a matcher for a keyword dictionary.
 
-    for tag, words in keywords.items():
-        # Skip invalid entries
-        if tag is None or words is None or not isinstance(words, list):
-            continue
+        Args:
+            keywords: Dictionary mapping tag names to keyword lists
+        """
+        self.tags: List[str] = []
+        self._results: Dict[str, FrozenSet[str]] = {}
+        tags_by_word: Dict[str, Set[str]] = {}
+
+        for tag, words in keywords.items():
+            # Skip invalid entries
+            if tag is None or words is None or not isinstance(words, list):
+                continue
+
+            self.tags.append(tag)
+            for word in words:
+                # Blank keywords are skipped, as load_tag_files does
+                if not word.strip():
+                    continue
+                tags_by_word.setdefault(word.lower(), set()).add(tag)
+
+        self._tags_by_word: Dict[str, frozenset] = {}
+        for word, tags in tags_by_word.items():
+            implied = set(tags)
+            for end in range(1, len(word)):
+                prefix = word[:end]
+                if prefix in tags_by_word and _is_word_char(word[end - 1]) != _is_word_char(word[end]):
+                    implied.update(tags_by_word[prefix])
+            key = word.casefold()
+            self._tags_by_word[key] = self._tags_by_word.get(key, frozenset()) | implied
+
+        self._automaton = None
+        self._keyword_set = None
+        self._bounded_keywords: List[Tuple[str, re.Pattern, Set[str]]] = []
+        self._token_tags: Dict[str, Set[str]] = {}
+        self._phrase_keywords: List[Tuple[str, re.Pattern, Set[str]]] = []
+        self._words: List[str] = []
+        self._pattern = None
+        if not tags_by_word:
+            return
+
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for word, tags in self._tags_by_word.items():
+                self._automaton.add_word(word, (len(word), tags))
+            self._automaton.make_automaton()
+            return
+
+        for word, tags in tags_by_word.items():
+            bounded = re.compile(r"\b{}\b".format(re.escape(word)), flags=re.IGNORECASE)
+            # Case folding can make a non-ASCII keyword match ASCII text that
+            # doesn't contain its lowercase form; the empty string disables
+            # the substring check for those
+            self._bounded_keywords.append((word if word.isascii() else '', bounded, tags))
+            if word.isascii() and _WORD_TOKEN.fullmatch(word):
+                self._token_tags[word] = tags
+            else:
+                self._phrase_keywords.append(self._bounded_keywords[-1])
+
+        self._words = list(tags_by_word)
+        self._compile_scanner()
+
+    def _compile_scanner(self) -> None:
+        """Compile the RE2 set, or the fused regex without google-re2, for non-ASCII text."""
+        if re2 is not None:
+            options = re2.Options()
+            options.case_sensitive = False
+            self._keyword_set = re2.Set.SearchSet(options)
+            for word in self._words:
+                self._keyword_set.Add(re2.escape(word))
+            self._keyword_set.Compile()
+        else:
+            alternation = "|".join(re.escape(word) for word in sorted(self._words, key=len, reverse=True))
+            self._pattern = re.compile(r"(?=\b({})\b)".format(alternation), flags=re.IGNORECASE)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Prepare the matcher for pickling, e.g. to send it to a worker process.
+
+        RE2 sets can't be pickled, so the set is left out and compiled again
+        when the matcher is unpickled. Remembered results are left out too.
+        """
+        state = self.__dict__.copy()
+        state['_keyword_set'] = None
+        state['_pattern'] = None
+        state['_results'] = {}
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled matcher, recompiling what __getstate__ left out."""
+        self.__dict__.update(state)
+        if self._words:
+            self._compile_scanner()
+
+    def match(self, text: str) -> FrozenSet[str]:
+        """Find the tags whose keywords occur in text.
+
+        Args:
+            text: The text to search
+
+        Returns:
+            Set of matching tag names
+        """
+        found = self._results.get(text)
+        if found is None:
+            if len(self._results) >= MATCH_CACHE_SIZE:
+                self._results.clear()
+            found = self._results[text] = frozenset(self._scan(text))
+        return found
+
+    def _scan(self, text: str) -> Set[str]:
+        """Search text for every keyword without using remembered results.
+
+        Args:
+            text: The text to search
+
+        Returns:
+            Set of matching tag names
+        """
+        found: Set[str] = set()
+
+        if self._automaton is not None:
+            folded = text.casefold()
+            last = len(folded) - 1
+            for end, (length, tags) in self._automaton.iter(folded):
+                if tags <= found:
+                    continue
+                start = end - length + 1
+                # Emulate \b on both sides of the hit
+                if (start > 0 and _is_word_char(folded[start - 1])) == _is_word_char(folded[start]):
+                    continue
+                if (end < last and _is_word_char(folded[end + 1])) == _is_word_char(folded[end]):
+                    continue
+                found.update(tags)
+        elif text.isascii():
+            lowered = text.lower()
+            for token in set(_WORD_TOKEN.findall(lowered)):
+                tags = self._token_tags.get(token)
+                if tags is not None:
+                    found.update(tags)
+            for word, bounded, tags in self._phrase_keywords:
+                if word in lowered and not tags <= found and bounded.search(text):
+                    found.update(tags)
+        elif self._keyword_set is not None:
+            for index in self._keyword_set.Match(text) or ():
+                _, bounded, tags = self._bounded_keywords[index]
+                if not tags <= found and bounded.search(text):
+                    found.update(tags)
+        elif self._pattern is not None:
+            for hit in self._pattern.finditer(text):
+                found.update(self._tags_by_word.get(hit.group(1).casefold(), ()))
+
+        return found
+
+
+def compile_keywords(keywords: Dict[str, List[str]]) -> KeywordMatcher:
+    """Compile a keyword dictionary into a reusable matcher.
+
+    Args:
+        keywords: Dictionary mapping tag names to keyword lists
+
+    Returns:
+        KeywordMatcher for the dictionary
+    """
+    return KeywordMatcher(keywords)
+
+
+def _get_matcher(keywords: Union[Dict[str, List[str]], KeywordMatcher]) -> KeywordMatcher:
+    """Get the matcher for a keyword dictionary, compiling on first use.
+
+    Args:
+        keywords: Dictionary mapping tag names to keyword lists, or an
+            already compiled KeywordMatcher
+
+    Returns:
+        KeywordMatcher for the dictionary
+    """
+    if isinstance(keywords, KeywordMatcher):
+        return keywords
+
+    entry = _MATCHER_CACHE.get(id(keywords))
+    if entry is None:
+        if len(_MATCHER_CACHE) >= MATCHER_CACHE_SIZE:
+            # Evict the matcher cached first
+            del _MATCHER_CACHE[next(iter(_MATCHER_CACHE))]
+
+        # A new dictionary with the same keywords, such as one reloaded from
+        # unchanged tag files, shares the matcher already compiled for them
+        try:
+            matcher = _compile_fingerprint(_keywords_fingerprint(keywords))
+        except TypeError:
+            # Unhashable entries; KeywordMatcher will skip or reject them
+            matcher = compile_keywords(keywords)
+        entry = _MATCHER_CACHE[id(keywords)] = (keywords, matcher)
+
+    return entry[1]
+
+
+def _keywords_fingerprint(keywords: Dict[str, List[str]]) -> Tuple[Tuple[str, Optional[Tuple[str, ...]]], ...]:
+    """Build a hashable snapshot of a keyword dictionary's contents.
 
-        pattern = r"\b(?:{})\b".format("|".join(re.escape(word) for word in words))
-        if re.search(pattern, description, flags=re.IGNORECASE):
-            matching_tags.append(tag)
+    Args:
+        keywords: Dictionary mapping tag names to keyword lists
+
+    Returns:
+        Tuple of (tag, keywords) pairs; keywords is None for entries that
+        KeywordMatcher skips
 
-    return matching_tags
+    Raises:
+        TypeError: If a tag name or keyword is unhashable
+    """
+    fingerprint = tuple(
+        (tag, tuple(words) if isinstance(words, list) else None)
+        for tag, words in keywords.items()
+    )
+    hash(fingerprint)
+    return fingerprint
 
 
-def split_words(match: re.Match) -> str:
-    """Split CamelCase words by inserting spaces before capitals.
+@lru_cache(maxsize=MATCHER_CACHE_SIZE)
+def _compile_fingerprint(fingerprint: Tuple[Tuple[str, Optional[Tuple[str, ...]]], ...]) -> KeywordMatcher:
+    """Compile a matcher for a keyword dictionary snapshot, cached by contents.
 
     Args:
-        match: Regex match object
+        fingerprint: Keyword dictionary snapshot from _keywords_fingerprint
 
     Returns:
-        Modified string with spaces
+        KeywordMatcher for the keywords
     """
-    word = match.group(0)
-    if len(word) > 1 and word.isupper():
-        return word
-    return ' ' + word
+    return compile_keywords({
+        tag: list(words) if words is not None else None
+        for tag, words in fingerprint
+    })
+
+
+def extract_tags(
+    description: str,
+    keywords: Optional[Union[Dict[str, List[str]], KeywordMatcher]] = None
+) -> List[str]:
+    """Extract tags from a description based on keyword matching.
 
+    A keyword dictionary is compiled into a matcher the first time it is
+    used and the matcher is reused for that dictionary, so don't modify a
+    dictionary after passing it in; pass a new one instead.
 
+    Args:
+        description: The text to extract tags from
+        keywords: Optional keyword dictionary or compiled KeywordMatcher.
+            If None, uses default. Must not be modified after use.
+
+    Returns:
+        List of matching tag names
+    """
+    if keywords is None:
+        keywords = _default_keywords()
+
+    matcher = _get_matcher(keywords)
+    found = matcher.match(description)
+    return [tag for tag in matcher.tags if tag in found]
+
+
+@lru_cache(maxsize=8192)
 def expand_name(name: str) -> str:
     """Expand a CamelCase name by inserting spaces.
 
+    Results are cached per name.
+
     Args:
         name: The CamelCase name to expand
 
     Returns:
         Name with spaces inserted before capital letters
     """
-    modified_name = re.sub(
-        r'([A-Z](?=[a-z])|[A-Z]{2,}(?=[A-Z]))',
-        split_words,
-        name
-    ).strip()
-    return modified_name
+    return _CAMEL_CASE_BOUNDARY.sub(' ', name).strip()
+
 
+def tag_event(
+    event: Dict[str, Any],
+    keywords: Optional[Union[Dict[str, List[str]], KeywordMatcher]] = None
+) -> Dict[str, Any]:
+    """Add tags and expanded name to an event dictionary entry in place.
 
-def tag_event(event: Dict[str, Any], keywords: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
-    """Add tags and expanded name to an event dictionary entry.
+    The event is updated directly rather than copied; pass a copy to keep
+    the original unchanged.
 
     Args:
         event: Event dictionary with at least 'name' and 'description' fields
-        keywords: Optional keyword dictionary. If None, uses default.
+        keywords: Optional keyword dictionary or compiled KeywordMatcher.
+            If None, uses default. Must not be modified after use, as for
+            extract_tags.
 
     Returns:
-        Event dictionary with 'name_expanded' and 'tags' fields added
+        The same event dictionary, with 'name_expanded' and 'tags' fields added
     """
     if keywords is None:
-        keywords = get_keywords()
+        keywords = _default_keywords()
 
     # Expand the name
     expanded_name = expand_name(event['name'])
     event['name_expanded'] = expanded_name
 
     # Extract tags from both description and expanded name
-    tag_from_description = extract_tags(event.get('description', ''), keywords)
-    tag_from_name = extract_tags(expanded_name, keywords)
-
-    # Combine, deduplicate, and filter None values before sorting
-    all_tags = tag_from_description + tag_from_name
-    event['tags'] = sorted([tag for tag in set(all_tags) if tag is not None])
+    matcher = _get_matcher(keywords)
+    tags = matcher.match(event.get('description', '')) | matcher.match(expanded_name)
+    event['tags'] = sorted(tags)
 
     return event
 
 
+def _init_worker(keywords: Union[Dict[str, List[str]], KeywordMatcher]) -> None:
+    """Set up a tagging worker process with its keywords and compiled matcher.
+
+    Args:
+        keywords: Dictionary mapping tag names to keyword lists, or an
+            already compiled KeywordMatcher
+    """
+    global _WORKER_KEYWORDS
+
+    _WORKER_KEYWORDS = keywords
+    _get_matcher(keywords)
+
+
+def _tag_chunk_in_worker(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Tag a chunk of events inside a worker process started with _init_worker.
+
+    Args:
+        events: Event dictionaries with at least 'name' and 'description' fields
+
+    Returns:
+        Event dictionaries with 'name_expanded' and 'tags' fields added
+    """
+    return [tag_event(event, _WORKER_KEYWORDS) for event in events]
+
+
+def tag_events(
+    events: Iterable[Dict[str, Any]],
+    keywords: Optional[Union[Dict[str, List[str]], KeywordMatcher]] = None,
+    workers: int = 1
+) -> Iterator[Dict[str, Any]]:
+    """Tag events lazily, optionally spreading the work over several processes.
+
+    With one worker, events are tagged in place as they are consumed. With
+    more, events are sent in chunks to a process pool and copies are yielded
+    in input order. Only a few chunks per worker are read ahead of the
+    consumer, so memory use stays bounded for large inputs.
+
+    Args:
+        events: Event dictionaries to tag
+        keywords: Optional keyword dictionary or compiled KeywordMatcher.
+            If None, uses default.
+        workers: Number of processes to tag with (default: 1)
+
+    Yields:
+        Each event with 'name_expanded' and 'tags' fields added
+    """
+    if keywords is None:
+        keywords = _default_keywords()
+
+    if workers <= 1:
+        for event in events:
+            yield tag_event(event, keywords)
+        return
+
+    events = iter(events)
+    chunks = iter(lambda: list(islice(events, PARALLEL_CHUNK_SIZE)), [])
+    max_pending = workers * PARALLEL_CHUNKS_PER_WORKER
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(keywords,)) as executor:
+        pending: Deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_tag_chunk_in_worker, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def iter_tagged_events(
+    events: Iterable[Dict[str, Any]],
+    tag_files: Optional[List[str]] = None,
+    workers: int = 1
+) -> Iterator[Dict[str, Any]]:
+    """Tag events one at a time with keywords from tag files.
+
+    Streaming counterpart of tag_dictionary: events are yielded as they are
+    tagged, so large inputs never have to be held in memory.
+
+    Args:
+        events: Event dictionaries to tag
+        tag_files: Optional list of tag file paths to use
+        workers: Number of processes to tag with (default: 1)
+
+    Yields:
+        Each event with 'name_expanded' and 'tags' fields added
+    """
+    yield from tag_events(events, get_keywords(tag_files), workers)
+
+
 def tag_dictionary(
     events: List[Dict[str, Any]],
-    tag_files: Optional[List[str]] = None
+    tag_files: Optional[List[str]] = None,
+    workers: int = 1
 ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """Tag all events in a dictionary.
 
     Args:
         events: List of event dictionaries
         tag_files: Optional list of tag file paths to use
+        workers: Number of processes to tag with (default: 1)
 
     Returns:
         Tuple of (tagged_events, untagged_events)
     """
-    # Load keywords once for all events
-    keywords = get_keywords(tag_files)
-
     tagged_events = []
     untagged_events = []
 
-    for event in events:
-        tagged_event = tag_event(event, keywords)
+    for tagged_event in iter_tagged_events(events, tag_files, workers):
         tagged_events.append(tagged_event)
 
         # Track events with no tags
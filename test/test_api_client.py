@@ -0,0 +1,201 @@
+"""Tests for the FDR API client (HTTP calls are mocked)."""
+
+import json
+import threading
+from unittest.mock import patch
+
+import requests
+
+from falcon_fdr_dictionary.api_client import FDRClient
+
+
+def make_response(status_code, payload):
+    """Build a requests.Response with a JSON body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(payload).encode('utf-8')
+    return response
+
+
+class TestGetDictionaryPage:
+    """Tests for paged ID queries."""
+
+    def test_sends_paging_parameters(self):
+        """Test that limit and offset are sent as query parameters."""
+        client = FDRClient('id', 'secret')
+        payload = {'resources': ['1'], 'meta': {'pagination': {'total': 1}}}
+
+        with patch.object(client, '_request', return_value=make_response(200, payload)) as request:
+            result = client.get_dictionary_page(limit=10, offset=20)
+
+        assert request.call_args[0][0].endswith('/fdr/queries/schema-events/v1')
+        assert request.call_args[1]['params'] == {'limit': 10, 'offset': 20}
+        assert result['status_code'] == 200
+        assert result['resources'] == ['1']
+
+
+class TestIterDictionaryPages:
+    """Tests for concurrent page queries."""
+
+    def test_yields_pages_in_offset_order(self):
+        """Test that pages come back in offset order with their offsets."""
+        client = FDRClient('id', 'secret')
+
+        def fake_page(limit, offset):
+            return {'status_code': 200, 'resources': [str(offset + i) for i in range(limit)]}
+
+        with patch.object(client, 'get_dictionary_page', side_effect=fake_page):
+            pages = list(client.iter_dictionary_pages([200, 400, 600], limit=2))
+
+        assert [offset for offset, _ in pages] == [200, 400, 600]
+        assert pages[1][1]['resources'] == ['400', '401']
+
+    def test_requests_start_before_iteration(self):
+        """Test that page requests are sent before the first page is consumed."""
+        client = FDRClient('id', 'secret')
+        requested = threading.Event()
+
+        def fake_page(limit, offset):
+            requested.set()
+            return {'status_code': 200, 'resources': []}
+
+        with patch.object(client, 'get_dictionary_page', side_effect=fake_page):
+            pages = client.iter_dictionary_pages([200])
+            assert requested.wait(timeout=5)
+            assert list(pages) == [(200, {'status_code': 200, 'resources': []})]
+
+    def test_close_cancels_queued_pages(self):
+        """Test that closing before iterating cancels pages not yet requested."""
+        client = FDRClient('id', 'secret')
+        started = threading.Event()
+        release = threading.Event()
+        requested = []
+
+        def fake_page(limit, offset):
+            requested.append(offset)
+            started.set()
+            release.wait(timeout=5)
+            return {'status_code': 200, 'resources': []}
+
+        with patch.object(client, 'get_dictionary_page', side_effect=fake_page):
+            with client.iter_dictionary_pages([200, 400, 600], max_workers=1):
+                assert started.wait(timeout=5)
+                # Let the running request finish only after close() has
+                # cancelled the queued ones and started waiting
+                threading.Timer(0.1, release.set).start()
+
+        assert requested == [200]
+
+
+class TestGetDictionaryItems:
+    """Tests for batched entity lookups."""
+
+    def test_sends_all_ids_in_one_request(self):
+        """Test that every ID is sent as a repeated ids= parameter."""
+        client = FDRClient('id', 'secret')
+        payload = {'resources': [{'id': '1'}, {'id': '2'}]}
+
+        with patch.object(client, '_request', return_value=make_response(200, payload)) as request:
+            result = client.get_dictionary_items(['1', '2'])
+
+        url = request.call_args[0][0]
+        assert url.endswith('/fdr/entities/schema-events/v1')
+        assert request.call_args[1]['params'] == {'ids': ['1', '2']}
+        assert result['status_code'] == 200
+        assert result['resources'] == payload['resources']
+
+    def test_error_response(self):
+        """Test that non-200 responses return no resources."""
+        client = FDRClient('id', 'secret')
+
+        with patch.object(client, '_request', return_value=make_response(404, {})):
+            result = client.get_dictionary_items(['1'])
+
+        assert result['status_code'] == 404
+        assert result['resources'] == []
+        assert result['errors']
+
+
+class TestFetchDictionaryItems:
+    """Tests for concurrent batched fetching."""
+
+    def test_batches_ids(self):
+        """Test that IDs are split into batches and results keep batch order."""
+        client = FDRClient('id', 'secret')
+        event_ids = [str(i) for i in range(250)]
+        batch_sizes = []
+
+        def fake_items(ids):
+            batch_sizes.append(len(ids))
+            return {'status_code': 200, 'resources': [{'id': i} for i in ids]}
+
+        progress = []
+        with patch.object(client, 'get_dictionary_items', side_effect=fake_items):
+            items = client.fetch_dictionary_items(event_ids, batch_size=100, on_progress=progress.append)
+
+        assert sorted(batch_sizes) == [50, 100, 100]
+        assert [item['id'] for item in items] == event_ids
+        assert sum(progress) == 250
+
+    def test_skips_failed_batches(self):
+        """Test that batches that fail are omitted from the result."""
+        client = FDRClient('id', 'secret')
+
+        def fake_items(ids):
+            if '0' in ids:
+                return {'status_code': 500, 'resources': [], 'errors': ['HTTP 500']}
+            return {'status_code': 200, 'resources': [{'id': i} for i in ids]}
+
+        with patch.object(client, 'get_dictionary_items', side_effect=fake_items), \
+                patch('falcon_fdr_dictionary.api_client.console') as console_mock:
+            items = client.fetch_dictionary_items(['0', '1', '2'], batch_size=1)
+
+        assert [item['id'] for item in items] == ['1', '2']
+        message = console_mock.print.call_args[0][0]
+        assert 'HTTP 500' in message and '1 dictionary items' in message
+
+
+class TestRateLimit:
+    """Tests for rate limit back-off."""
+
+    def test_exhausted_limit_pauses_next_request(self):
+        """Test that an exhausted rate limit delays the next request."""
+        client = FDRClient('id', 'secret')
+        response = make_response(200, {})
+        response.headers['X-Ratelimit-Remaining'] = '0'
+        response.headers['X-Ratelimit-Retryafter'] = '1010'
+
+        with patch('falcon_fdr_dictionary.api_client.time') as mock_time:
+            mock_time.time.return_value = 1000.0
+            client._update_rate_limit(response)
+            client._wait_for_rate_limit()
+
+        mock_time.sleep.assert_called_once_with(10.0)
+
+    def test_remaining_limit_does_not_pause(self):
+        """Test that requests are not delayed while the limit has headroom."""
+        client = FDRClient('id', 'secret')
+        response = make_response(200, {})
+        response.headers['X-Ratelimit-Remaining'] = '5'
+        response.headers['X-Ratelimit-Retryafter'] = '1010'
+
+        with patch('falcon_fdr_dictionary.api_client.time') as mock_time:
+            mock_time.time.return_value = 1000.0
+            client._update_rate_limit(response)
+            client._wait_for_rate_limit()
+
+        mock_time.sleep.assert_not_called()
+
+
+class TestSession:
+    """Tests for the shared HTTP session."""
+
+    def test_context_manager_closes_session(self):
+        """Test that leaving the with block closes the session."""
+        client = FDRClient('id', 'secret')
+
+        with patch.object(client.session, 'close') as close:
+            with client:
+                close.assert_not_called()
+
+        close.assert_called_once_with()
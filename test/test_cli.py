@@ -0,0 +1,218 @@
+"""Tests for the command line interface."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from falcon_fdr_dictionary import jsonio
+from falcon_fdr_dictionary.cli import cli
+from falcon_fdr_dictionary.tagging import tag_event, tag_events
+
+
+EVENTS = [
+    {'id': '2', 'name': 'ProcessRollup2', 'description': 'Process started'},
+    {'id': '1', 'name': 'DnsRequest', 'description': 'DNS lookup'},
+    {'id': '3', 'name': 'Unknown', 'description': 'Something else'},
+]
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    """Run commands in an empty directory with no .env file or credentials."""
+    monkeypatch.chdir(tmp_path)
+    with patch.dict(os.environ, {}, clear=True), \
+            patch('falcon_fdr_dictionary.config.find_dotenv', return_value=''):
+        yield CliRunner()
+
+
+def page(ids, total=4):
+    """Build a successful page of event IDs."""
+    return {'status_code': 200, 'resources': ids, 'meta': {'pagination': {'total': total}}}
+
+
+def page_results(results):
+    """Yield page results from a generator, which can be closed like DictionaryPages."""
+    yield from results
+
+
+@pytest.fixture
+def client():
+    """Replace FDRClient in the CLI with a mock serving a four-event dictionary."""
+    with patch('falcon_fdr_dictionary.cli.FDRClient') as client_class:
+        client = client_class.return_value
+        client.authenticate.return_value = True
+        client.get_dictionary_page.return_value = page(['4', '2'])
+        client.iter_dictionary_pages.side_effect = lambda offsets: page_results(
+            [(offset, page(['3', '1'])) for offset in offsets]
+        )
+        client.fetch_dictionary_items.side_effect = lambda ids, batch_size, on_progress: [
+            {'id': event_id, 'name': f'Event{event_id}'} for event_id in ids
+        ]
+        yield client
+
+
+def generate(runner, output, *args):
+    """Run generate with credentials on the command line."""
+    return runner.invoke(
+        cli,
+        ['generate', '--client-id', 'id', '--client-secret', 'secret', '-o', str(output), *args]
+    )
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    """Write an untagged dictionary and return its path."""
+    path = tmp_path / 'dictionary.json'
+    path.write_bytes(jsonio.dumps(EVENTS))
+    return path
+
+
+class TestGenerate:
+    """Tests for the generate command."""
+
+    def test_writes_sorted_compact_output(self, runner, client, tmp_path):
+        """Test that events are sorted by ID and written compact by default."""
+        output = tmp_path / 'out.json'
+
+        result = generate(runner, output)
+
+        assert result.exit_code == 0, result.output
+        expected = [{'id': event_id, 'name': f'Event{event_id}'} for event_id in '1234']
+        assert output.read_bytes() == jsonio.dumps(expected, pretty=False)
+        assert not Path(f"{output}.part.jsonl").exists()
+
+    def test_pretty_output(self, runner, client, tmp_path):
+        """Test that --pretty indents the output."""
+        output = tmp_path / 'out.json'
+
+        result = generate(runner, output, '--pretty')
+
+        assert result.exit_code == 0, result.output
+        assert output.read_bytes() == jsonio.dumps(json.loads(output.read_text()))
+
+    def test_removes_spool_file_on_error(self, runner, client, tmp_path):
+        """Test that the spool file is deleted when fetching fails."""
+        client.fetch_dictionary_items.side_effect = RuntimeError("connection lost")
+        output = tmp_path / 'out.json'
+
+        result = generate(runner, output)
+
+        assert result.exit_code == 1
+        assert 'connection lost' in result.output
+        assert not Path(f"{output}.part.jsonl").exists()
+        assert not output.exists()
+
+    def test_closes_pages_on_error(self, runner, client, tmp_path):
+        """Test that queued page requests are stopped when the first page's details fail."""
+        client.iter_dictionary_pages.side_effect = None
+        client.fetch_dictionary_items.side_effect = RuntimeError("connection lost")
+
+        result = generate(runner, tmp_path / 'out.json')
+
+        assert result.exit_code == 1
+        client.iter_dictionary_pages.return_value.close.assert_called_once()
+
+    def test_page_error_stops_fetching(self, runner, client, tmp_path, monkeypatch):
+        """Test that a failed page ends the run with the pages fetched so far."""
+        monkeypatch.setattr('falcon_fdr_dictionary.cli.PAGE_SIZE', 2)
+        client.get_dictionary_page.return_value = page(['4', '2'], total=8)
+        client.iter_dictionary_pages.side_effect = lambda offsets: page_results([
+            (2, {'status_code': 500, 'resources': [], 'errors': ['HTTP 500']}),
+            (4, page(['3', '1'], total=8)),
+        ])
+        output = tmp_path / 'out.json'
+
+        result = generate(runner, output)
+
+        assert 'Error at offset 2' in result.output
+        assert client.fetch_dictionary_items.call_count == 1
+        assert [event['id'] for event in json.loads(output.read_text())] == ['2', '4']
+
+    def test_warns_about_missing_events(self, runner, client, tmp_path):
+        """Test that events lost to failed batches are reported."""
+        client.fetch_dictionary_items.side_effect = lambda ids, batch_size, on_progress: [
+            {'id': event_id} for event_id in ids if event_id != '3'
+        ]
+
+        result = generate(runner, tmp_path / 'out.json')
+
+        assert result.exit_code == 0, result.output
+        assert '1 of 4 events could not be retrieved' in result.output
+
+    def test_skips_events_without_id(self, runner, client, tmp_path):
+        """Test that a schema without an ID is dropped instead of breaking the sort."""
+        client.fetch_dictionary_items.side_effect = lambda ids, batch_size, on_progress: [
+            {'id': event_id} if event_id != '3' else {'name': 'NoId'} for event_id in ids
+        ]
+        output = tmp_path / 'out.json'
+
+        result = generate(runner, output)
+
+        assert result.exit_code == 0, result.output
+        assert 'Skipped 1 event schemas without an ID' in result.output
+        assert [event['id'] for event in json.loads(output.read_text())] == ['1', '2', '4']
+
+
+class TestTag:
+    """Tests for the tag command."""
+
+    def test_tag_onto_input_file(self, runner, input_file):
+        """Test that a dictionary can be tagged in place."""
+        result = runner.invoke(cli, ['tag', str(input_file), str(input_file)])
+
+        assert result.exit_code == 0, result.output
+        tagged = json.loads(input_file.read_text())
+        assert [event['id'] for event in tagged] == ['2', '1', '3']
+        assert tagged[0]['tags'] == ['process']
+        assert not Path(f"{input_file}.part").exists()
+
+    def test_parallel_compact_output(self, runner, input_file, tmp_path):
+        """Test that -j 2 --compact writes the same events as serial tagging, compact."""
+        output = tmp_path / 'tagged.json'
+
+        result = runner.invoke(cli, ['tag', str(input_file), str(output), '-j', '2', '--compact'])
+
+        assert result.exit_code == 0, result.output
+        expected = [tag_event(event) for event in json.loads(input_file.read_text())]
+        assert output.read_bytes() == jsonio.dumps(expected, pretty=False)
+
+    def test_jobs_zero_means_one_per_cpu(self, runner, input_file, tmp_path):
+        """Test that -j 0 starts one worker per CPU, like TAG_WORKERS=0."""
+        with patch('falcon_fdr_dictionary.config.os.cpu_count', return_value=3), \
+                patch('falcon_fdr_dictionary.cli.tag_events', side_effect=tag_events) as tag_mock:
+            result = runner.invoke(cli, ['tag', str(input_file), str(tmp_path / 'tagged.json'), '-j', '0'])
+
+        assert result.exit_code == 0, result.output
+        assert tag_mock.call_args[0][2] == 3
+
+    def test_broken_input_keeps_output(self, runner, tmp_path):
+        """Test that a decode error leaves an existing output file untouched."""
+        broken = tmp_path / 'broken.json'
+        broken.write_bytes(b'[{"id": "1", "name": "FileWrite", "description": "File"}, {')
+        output = tmp_path / 'tagged.json'
+        output.write_text('previous')
+
+        result = runner.invoke(cli, ['tag', str(broken), str(output)])
+
+        assert result.exit_code == 1
+        assert 'Invalid JSON' in result.output
+        assert output.read_text() == 'previous'
+        assert not Path(f"{output}.part").exists()
+
+    def test_non_array_input_keeps_output(self, runner, tmp_path):
+        """Test that a top-level object is rejected and an existing output file is kept."""
+        response = tmp_path / 'response.json'
+        response.write_bytes(jsonio.dumps({'resources': EVENTS}))
+        output = tmp_path / 'tagged.json'
+        output.write_text('previous')
+
+        result = runner.invoke(cli, ['tag', str(response), str(output)])
+
+        assert result.exit_code == 1
+        assert 'Invalid JSON' in result.output
+        assert output.read_text() == 'previous'
+        assert not Path(f"{output}.part").exists()
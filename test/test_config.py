@@ -0,0 +1,105 @@
+"""Tests for configuration loading."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from falcon_fdr_dictionary.config import CLOUD_REGIONS, Config, resolve_tag_workers
+
+
+ENV_FILE = """FALCON_CLIENT_ID=file_id
+FALCON_CLIENT_SECRET=file_secret
+LOG_LEVEL=DEBUG
+TAG_WORKERS=4
+"""
+
+
+@pytest.fixture
+def env_file(tmp_path):
+    """Write a .env file and return its path."""
+    path = tmp_path / '.env'
+    path.write_text(ENV_FILE)
+    return path
+
+
+class TestFromEnv:
+    """Tests for Config.from_env."""
+
+    def test_reads_env_file(self, env_file):
+        """Test that values come from the .env file."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = Config.from_env(str(env_file))
+
+        assert config.falcon_client_id == 'file_id'
+        assert config.log_level == 'DEBUG'
+        assert config.tag_workers == 4
+        assert config.falcon_client_cloud == 'auto'
+
+    def test_environment_overrides_env_file(self, env_file):
+        """Test that variables already in the environment win over .env."""
+        with patch.dict(os.environ, {'LOG_LEVEL': 'ERROR'}, clear=True):
+            config = Config.from_env(str(env_file))
+
+        assert config.log_level == 'ERROR'
+
+    def test_does_not_modify_environment(self, env_file):
+        """Test that loading .env leaves os.environ untouched."""
+        with patch.dict(os.environ, {}, clear=True):
+            Config.from_env(str(env_file))
+
+            assert 'FALCON_CLIENT_ID' not in os.environ
+
+    def test_rereads_changed_env_file(self, env_file):
+        """Test that an edited .env file is read again."""
+        with patch.dict(os.environ, {}, clear=True):
+            Config.from_env(str(env_file))
+
+            env_file.write_text(ENV_FILE.replace('DEBUG', 'WARNING'))
+            stat = env_file.stat()
+            os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            assert Config.from_env(str(env_file)).log_level == 'WARNING'
+
+    def test_missing_credentials(self, tmp_path):
+        """Test that missing credentials raise ValueError."""
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(ValueError):
+                Config.from_env(str(tmp_path / 'missing.env'))
+
+
+class TestParseTagWorkers:
+    """Tests for TAG_WORKERS parsing."""
+
+    def test_default(self):
+        """Test that an unset value means one worker."""
+        assert Config._parse_tag_workers(None) == 1
+
+    def test_zero_means_all_cpus(self):
+        """Test that 0 means one worker per CPU."""
+        with patch('falcon_fdr_dictionary.config.os.cpu_count', return_value=8):
+            assert Config._parse_tag_workers('0') == 8
+
+    def test_invalid(self):
+        """Test that invalid values fall back to one worker."""
+        assert Config._parse_tag_workers('many') == 1
+        assert Config._parse_tag_workers('-3') == 1
+
+    def test_resolve_tag_workers(self):
+        """Test resolving a worker count given as a number, as -j does."""
+        with patch('falcon_fdr_dictionary.config.os.cpu_count', return_value=8):
+            assert resolve_tag_workers(0) == 8
+        assert resolve_tag_workers(3) == 3
+
+
+class TestValidateCloudRegion:
+    """Tests for cloud region validation."""
+
+    def test_known_regions(self):
+        """Test that every listed region is accepted."""
+        for region in CLOUD_REGIONS:
+            assert Config('id', 'secret', region).validate_cloud_region()
+
+    def test_unknown_region(self):
+        """Test that other values are rejected."""
+        assert not Config('id', 'secret', 'mars1').validate_cloud_region()
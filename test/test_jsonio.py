@@ -0,0 +1,100 @@
+"""Tests for JSON encoding and decoding helpers."""
+
+import io
+import json
+
+import pytest
+
+from falcon_fdr_dictionary import jsonio
+
+
+EVENTS = [
+    {'name': 'ProcessRollup2', 'id': '2', 'tags': ['process'], 'description': 'Process started — «quoted»'},
+    {'name': 'DnsRequest', 'id': '1', 'tags': [], 'fields': [{'type': 'string', 'name': 'DomainName'}]},
+]
+
+
+class TestDumps:
+    """Tests for document and line serialization."""
+
+    def test_dumps_layout(self):
+        """Test that documents are indented by two spaces with sorted keys."""
+        expected = json.dumps(EVENTS, indent=2, sort_keys=True, ensure_ascii=False).encode('utf-8')
+
+        assert jsonio.dumps(EVENTS) == expected
+
+    def test_dumps_compact(self):
+        """Test that compact documents have no whitespace and keep key order."""
+        expected = json.dumps(EVENTS, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+        assert jsonio.dumps(EVENTS, pretty=False) == expected
+
+    def test_dumps_line(self):
+        """Test that a line is compact and newline-terminated."""
+        line = jsonio.dumps_line(EVENTS[1])
+
+        assert line.endswith(b'\n')
+        assert b'\n' not in line[:-1]
+        assert jsonio.loads(line) == EVENTS[1]
+
+    def test_loads_accepts_str_and_bytes(self):
+        """Test parsing from both str and bytes."""
+        assert jsonio.loads('{"a": 1}') == {'a': 1}
+        assert jsonio.loads(b'{"a": 1}') == {'a': 1}
+
+    def test_loads_invalid(self):
+        """Test that malformed input raises JSONDecodeError."""
+        with pytest.raises(jsonio.JSONDecodeError):
+            jsonio.loads(b'{not json')
+
+
+class TestArrays:
+    """Tests for streaming array reads and writes."""
+
+    def test_write_array_matches_dumps(self):
+        """Test that streamed output is byte-identical to dumps."""
+        buffer = io.BytesIO()
+
+        count = jsonio.write_array(buffer, iter(EVENTS))
+
+        assert count == 2
+        assert buffer.getvalue() == jsonio.dumps(EVENTS)
+
+    def test_write_compact_array_matches_dumps(self):
+        """Test that streamed compact output is byte-identical to dumps."""
+        buffer = io.BytesIO()
+
+        count = jsonio.write_array(buffer, iter(EVENTS), pretty=False)
+
+        assert count == 2
+        assert buffer.getvalue() == jsonio.dumps(EVENTS, pretty=False)
+
+    def test_write_empty_array(self):
+        """Test writing no items."""
+        buffer = io.BytesIO()
+
+        assert jsonio.write_array(buffer, []) == 0
+        assert buffer.getvalue() == jsonio.dumps([])
+
+    def test_iter_array_round_trip(self, tmp_path):
+        """Test reading back a written array item by item."""
+        path = tmp_path / 'events.json'
+        path.write_bytes(jsonio.dumps(EVENTS))
+
+        assert list(jsonio.iter_array(str(path))) == EVENTS
+
+    def test_iter_array_invalid(self, tmp_path):
+        """Test that a malformed file raises one of DECODE_ERRORS."""
+        path = tmp_path / 'broken.json'
+        path.write_bytes(b'[{"id": 1}, {')
+
+        with pytest.raises(jsonio.DECODE_ERRORS):
+            list(jsonio.iter_array(str(path)))
+
+    def test_iter_array_not_an_array(self, tmp_path):
+        """Test that a top-level object raises instead of yielding nothing."""
+        path = tmp_path / 'response.json'
+        path.write_bytes(jsonio.dumps({'resources': EVENTS}))
+
+        with pytest.raises(jsonio.DECODE_ERRORS):
+            list(jsonio.iter_array(str(path)))
@@ -1,17 +1,27 @@
 """Comprehensive tests for tagging functionality."""
 
+import itertools
 import json
+import multiprocessing
+import os
+import pickle
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
 
+from falcon_fdr_dictionary import tagging
 from falcon_fdr_dictionary.tagging import (
+    compile_keywords,
     extract_tags,
     expand_name,
     tag_event,
     tag_dictionary,
+    tag_events,
+    iter_tagged_events,
     load_tag_files,
     get_keywords,
     get_default_tags_file,
@@ -73,6 +83,142 @@ class TestExtractTags:
         assert 'test' in tags
 
 
+class TestCompileKeywords:
+    """Tests for keyword matcher compilation."""
+
+    def test_compile_skips_invalid_tags(self):
+        """Test that only valid tags are compiled."""
+        keywords = {
+            'custom': ['special', 'unique'],
+            'invalid': None,
+            'test': ['testing']
+        }
+        matcher = compile_keywords(keywords)
+
+        assert matcher.tags == ['custom', 'test']
+
+    def test_compiled_matcher_escapes_keywords(self):
+        """Test that regex metacharacters in keywords match literally."""
+        matcher = compile_keywords({'dotted': ['a.b']})
+
+        assert matcher.match("value A.B here") == {'dotted'}
+        assert matcher.match("value axb here") == set()
+
+    def test_overlapping_keywords(self):
+        """Test that keywords nested inside longer keywords still match."""
+        matcher = compile_keywords({
+            'memory': ['address space'],
+            'network': ['address'],
+            'kernel': ['space'],
+        })
+
+        assert matcher.match("Reserved address space.") == {'memory', 'network', 'kernel'}
+        assert matcher.match("Reserved address.") == {'network'}
+
+    def test_shared_keyword(self):
+        """Test that a keyword listed under two tags matches both."""
+        matcher = compile_keywords({'dns': ['dns'], 'network': ['dns', 'socket']})
+
+        assert matcher.match("DNS lookup") == {'dns', 'network'}
+
+    def test_extract_tags_reuses_keyword_dict(self):
+        """Test repeated extraction with the same custom dictionary."""
+        custom_keywords = {'custom': ['special']}
+
+        assert extract_tags("A special case.", custom_keywords) == ['custom']
+        assert extract_tags("An ordinary case.", custom_keywords) == []
+
+    def test_new_keyword_dict_sees_new_keywords(self):
+        """Test the documented way to change keywords: pass a new dictionary."""
+        custom_keywords = {'custom': ['special']}
+        assert extract_tags("A unique thing.", custom_keywords) == []
+
+        updated = {tag: words + ['unique'] for tag, words in custom_keywords.items()}
+
+        assert extract_tags("A unique thing.", updated) == ['custom']
+
+    def test_matchers_cached_per_keyword_dict(self):
+        """Test that alternating keyword dictionaries reuses their matchers."""
+        custom_keywords = {'custom': ['special']}
+
+        with patch('falcon_fdr_dictionary.tagging.compile_keywords',
+                   wraps=tagging.compile_keywords) as compile_mock:
+            for _ in range(3):
+                extract_tags("A special file.", custom_keywords)
+                extract_tags("A special file.")
+
+        assert compile_mock.call_count <= 2
+
+    @pytest.mark.parametrize('backend', ['ahocorasick', 're2', 're'])
+    def test_backends_agree(self, backend, monkeypatch):
+        """Test that every matching backend gives the same tags."""
+        if backend == 're':
+            monkeypatch.setattr(tagging, 'ahocorasick', None)
+            monkeypatch.setattr(tagging, 're2', None)
+        else:
+            pytest.importorskip(backend)
+            if backend == 're2':
+                monkeypatch.setattr(tagging, 'ahocorasick', None)
+
+        matcher = compile_keywords({
+            'memory': ['address space'],
+            'network': ['address', 'dns', 'c2'],
+            'kernel': ['space', '.sys'],
+            'dns': ['dns'],
+            'blank': ['', ' '],
+        })
+
+        assert matcher.match("Reserved ADDRESS SPACE.") == {'memory', 'network', 'kernel'}
+        assert matcher.match("DNS-over-HTTPS lookup") == {'dns', 'network'}
+        assert matcher.match("dnsquery, addresses, spaces") == set()
+        assert matcher.match("dns_query, c2c, 2dns") == set()
+        assert matcher.match("Loaded driver.sys from C2") == {'kernel', 'network'}
+        assert matcher.match("file .sys") == set()
+        assert matcher.match("Größe: address spaceé") == {'network'}
+        assert matcher.match("Größe: address space") == {'memory', 'network', 'kernel'}
+        assert matcher.match("") == set()
+
+    def test_match_results_cached(self, monkeypatch):
+        """Test that repeated texts reuse their result and old ones are evicted."""
+        monkeypatch.setattr(tagging, 'MATCH_CACHE_SIZE', 2)
+        matcher = compile_keywords({'dns': ['dns'], 'file': ['file']})
+
+        first = matcher.match("DNS lookup")
+        assert matcher.match("DNS lookup") is first
+
+        assert matcher.match("file write") == {'file'}
+        assert matcher.match("nothing") == set()
+        assert matcher.match("DNS lookup") == {'dns'}
+        assert len(matcher._results) == 2
+
+    @pytest.mark.parametrize('backend', ['ahocorasick', 're2', 're'])
+    def test_matcher_usable_in_spawned_worker(self, backend, monkeypatch):
+        """Test that a compiled matcher survives pickling into a spawned process."""
+        if backend == 're':
+            monkeypatch.setattr(tagging, 'ahocorasick', None)
+            monkeypatch.setattr(tagging, 're2', None)
+        else:
+            pytest.importorskip(backend)
+            if backend == 're2':
+                monkeypatch.setattr(tagging, 'ahocorasick', None)
+
+        matcher = compile_keywords({'dns': ['dns'], 'file': ['file']})
+        matcher.match("DNS lookup")
+
+        assert pickle.loads(pickle.dumps(matcher)).match("Größe: DNS") == {'dns'}
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            assert executor.submit(matcher.match, "File and DNS").result() == {'dns', 'file'}
+
+    def test_compiled_matcher_accepted_in_place_of_keywords(self):
+        """Test that extract_tags and tag_event take a compiled matcher."""
+        matcher = compile_keywords({'custom': ['special']})
+        event = {'name': 'SpecialEvent', 'description': 'Nothing here'}
+
+        assert extract_tags("A special case.", matcher) == ['custom']
+        assert tag_event(event, matcher)['tags'] == ['custom']
+
+
 class TestExpandName:
     """Tests for name expansion."""
 
@@ -101,6 +247,16 @@ class TestExpandName:
         """Test complex CamelCase."""
         assert expand_name("ProcessMemoryAllocation") == "Process Memory Allocation"
 
+    def test_expand_with_digits(self):
+        """Test that digits stay attached to the word they follow."""
+        assert expand_name("ProcessRollup2") == "Process Rollup2"
+        assert expand_name("Win32ProcessStart") == "Win32 Process Start"
+
+    def test_expand_trailing_acronym(self):
+        """Test that a trailing run of capitals stays on the preceding word."""
+        assert expand_name("NetworkConnectIP4") == "Network ConnectIP4"
+        assert expand_name("DnsRequestTTL") == "Dns RequestTTL"
+
 
 class TestTagEvent:
     """Tests for complete event tagging."""
@@ -138,6 +294,15 @@ class TestTagEvent:
         assert tagged['platform'] == 'linux'
         assert tagged['version'] == 1
 
+    def test_tag_event_updates_in_place(self):
+        """Test that the event itself is tagged and returned, not a copy."""
+        event = {'id': '1', 'name': 'DnsRequest', 'description': 'DNS query event'}
+
+        tagged = tag_event(event)
+
+        assert tagged is event
+        assert event['name_expanded'] == 'Dns Request'
+
     def test_tag_event_combines_name_and_description(self):
         """Test that tags are extracted from both name and description."""
         event = {
@@ -221,6 +386,82 @@ class TestTagDictionary:
         assert len(tagged) == 0
         assert len(untagged) == 0
 
+    def test_tag_dictionary_tags_events_in_place(self):
+        """Test that serial tagging returns the caller's event objects."""
+        events = [{'id': '1', 'name': 'FileWrite', 'description': 'File written'}]
+
+        tagged, _ = tag_dictionary(events)
+
+        assert tagged[0] is events[0]
+
+    def test_tag_dictionary_parallel_matches_serial(self):
+        """Test that tagging with worker processes gives the serial result in order."""
+        events = [
+            {'id': str(i), 'name': name, 'description': description}
+            for i, (name, description) in enumerate([
+                ('ProcessStart', 'Process started'),
+                ('FileWrite', 'File written'),
+                ('Unknown', 'Something else'),
+                ('DnsRequest', 'DNS request sent over the network'),
+            ] * 50)
+        ]
+
+        serial, serial_untagged = tag_dictionary([dict(e) for e in events])
+        parallel, parallel_untagged = tag_dictionary([dict(e) for e in events], workers=2)
+
+        assert parallel == serial
+        assert parallel_untagged == serial_untagged
+
+
+class TestTagEvents:
+    """Tests for lazy event tagging."""
+
+    def test_tag_events_is_lazy(self):
+        """Test that each event is tagged as soon as it is read."""
+        def events():
+            yield {'id': '1', 'name': 'ProcessStart', 'description': 'Process started'}
+            raise RuntimeError("input exhausted early")
+
+        tagged = tag_events(events())
+
+        assert next(tagged)['name_expanded'] == 'Process Start'
+        with pytest.raises(RuntimeError):
+            next(tagged)
+
+    def test_parallel_tag_events_reads_ahead_boundedly(self, monkeypatch):
+        """Test that parallel tagging doesn't read the whole input up front."""
+        monkeypatch.setattr(tagging, 'PARALLEL_CHUNK_SIZE', 2)
+        consumed = []
+
+        def events():
+            for number in itertools.count():
+                consumed.append(number)
+                yield {'id': str(number), 'name': 'ProcessStart', 'description': 'Process started'}
+
+        tagged = tag_events(events(), {'process': ['process']}, workers=2)
+        first = next(tagged)
+        tagged.close()
+
+        assert first['tags'] == ['process']
+        assert len(consumed) <= 2 * 2 * tagging.PARALLEL_CHUNKS_PER_WORKER + 1
+
+
+class TestIterTaggedEvents:
+    """Tests for streaming tagging from tag files."""
+
+    def test_iter_tagged_events_matches_tag_dictionary(self):
+        """Test that streamed events are tagged like tag_dictionary's."""
+        events = [
+            {'id': '1', 'name': 'ProcessStart', 'description': 'Process started'},
+            {'id': '2', 'name': 'Unknown', 'description': 'Something else'},
+        ]
+
+        streamed = iter_tagged_events(dict(e) for e in events)
+        tagged, _ = tag_dictionary([dict(e) for e in events])
+
+        assert not isinstance(streamed, list)
+        assert list(streamed) == tagged
+
 
 class TestLoadTagFiles:
     """Tests for loading tag files."""
@@ -254,6 +495,23 @@ class TestLoadTagFiles:
         finally:
             Path(temp_file).unlink()
 
+    def test_load_parses_each_file_once_until_changed(self, tmp_path):
+        """Test that an unchanged tag file isn't parsed again."""
+        tag_file = tmp_path / 'tags.yaml'
+        tag_file.write_text(yaml.dump({'custom': ['special']}))
+
+        with patch('falcon_fdr_dictionary.tagging.yaml.load', wraps=yaml.load) as load_mock:
+            load_tag_files([str(tag_file)])
+            assert load_tag_files([str(tag_file)]) == {'custom': ['special']}
+            assert load_mock.call_count == 1
+
+            tag_file.write_text(yaml.dump({'custom': ['unique']}))
+            stat = tag_file.stat()
+            os.utime(tag_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            assert load_tag_files([str(tag_file)]) == {'custom': ['unique']}
+            assert load_mock.call_count == 2
+
     def test_load_multiple_tag_files(self):
         """Test loading multiple tag files."""
         # Create first file
@@ -282,6 +540,8 @@ class TestLoadTagFiles:
             assert 'shared1' in keywords['shared']
             assert 'shared2' in keywords['shared']
             assert 'shared3' in keywords['shared']
+            # In first-seen order, without duplicates
+            assert keywords['shared'] == ['shared1', 'shared2', 'shared3']
         finally:
             Path(file1).unlink()
             Path(file2).unlink()
@@ -294,6 +554,45 @@ class TestLoadTagFiles:
         # Should return empty dict or continue with other files
         assert isinstance(keywords, dict)
 
+    def test_load_skips_non_string_tags_and_keywords(self):
+        """Test that non-string tag names and keywords are dropped at load time."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write("404:\n  - missing\nwindows:\n  - 4624\n  - '4625'\n  - logon\n")
+            temp_file = f.name
+
+        try:
+            keywords = load_tag_files([temp_file])
+
+            assert keywords == {'windows': ['4625', 'logon']}
+        finally:
+            Path(temp_file).unlink()
+
+    def test_load_canonicalizes_keywords(self, tmp_path, capsys):
+        """Test that keywords are lowercased and duplicates dropped with a warning."""
+        tag_file = tmp_path / 'tags.yaml'
+        tag_file.write_text("kernel:\n  - NTDLL\n  - ntoskrnl\n  - ntdll\n")
+
+        keywords = load_tag_files([str(tag_file)])
+
+        assert keywords == {'kernel': ['ntdll', 'ntoskrnl']}
+        assert 'duplicate' in capsys.readouterr().out
+
+    def test_load_skips_blank_keywords(self, tmp_path, capsys):
+        """Test that empty and whitespace-only keywords are dropped with a warning."""
+        tag_file = tmp_path / 'tags.yaml'
+        tag_file.write_text("file:\n  - ''\n  - '  '\n  - file\n")
+
+        keywords = load_tag_files([str(tag_file)])
+
+        assert keywords == {'file': ['file']}
+        assert 'blank keywords' in capsys.readouterr().out
+
+    def test_default_tags_have_no_duplicates(self, capsys):
+        """Test that the default tags file loads without duplicate warnings."""
+        load_tag_files()
+
+        assert 'duplicate' not in capsys.readouterr().out
+
     def test_load_invalid_yaml(self):
         """Test loading invalid YAML raises error."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
@@ -325,6 +624,17 @@ class TestGetKeywords:
         # Should be the same object (cached)
         assert kw1 is kw2
 
+    def test_default_keywords_skip_stat(self):
+        """Test that tagging with default keywords doesn't stat the tag file per call."""
+        keywords = get_keywords()
+
+        with patch('falcon_fdr_dictionary.tagging.os.stat') as stat_mock:
+            assert extract_tags("A file.") == ['file']
+            assert tag_event({'name': 'FileWrite', 'description': ''})['tags'] == ['file']
+
+        stat_mock.assert_not_called()
+        assert tagging._default_keywords() is keywords
+
     def test_get_keywords_force_reload(self):
         """Test force reload bypasses cache."""
         kw1 = get_keywords()
@@ -335,6 +645,55 @@ class TestGetKeywords:
         # But content should be the same
         assert kw1 == kw2
 
+    def test_force_reload_reuses_matcher_for_unchanged_keywords(self):
+        """Test that reloading unchanged tag files doesn't recompile the matcher."""
+        extract_tags("A file.", get_keywords())
+
+        with patch('falcon_fdr_dictionary.tagging.compile_keywords',
+                   wraps=tagging.compile_keywords) as compile_mock:
+            assert extract_tags("A file.", get_keywords(force_reload=True)) == ['file']
+
+        compile_mock.assert_not_called()
+
+    def test_equal_keyword_dicts_share_matcher(self):
+        """Test that separate dictionaries with the same keywords share a matcher."""
+        assert tagging._get_matcher({'custom': ['special'], 'bad': None}) is \
+            tagging._get_matcher({'custom': ['special'], 'bad': None})
+        assert tagging._get_matcher({'custom': ['special']}) is not \
+            tagging._get_matcher({'custom': ['other']})
+
+    def test_get_keywords_caches_custom_files(self):
+        """Test that custom tag files are cached until they change."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump({'custom': ['special']}, f)
+            temp_file = f.name
+
+        try:
+            kw1 = get_keywords([temp_file])
+            kw2 = get_keywords([temp_file])
+            assert kw1 is kw2
+
+            Path(temp_file).write_text(yaml.dump({'custom': ['unique']}))
+            stat = os.stat(temp_file)
+            os.utime(temp_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            kw3 = get_keywords([temp_file])
+            assert kw3 == {'custom': ['unique']}
+        finally:
+            Path(temp_file).unlink()
+
+    def test_force_reload_rereads_file_with_same_mtime(self, tmp_path):
+        """Test that force_reload picks up an edit that kept the modification time."""
+        tag_file = tmp_path / 'tags.yaml'
+        tag_file.write_text(yaml.dump({'custom': ['special']}))
+        stat = tag_file.stat()
+        assert get_keywords([str(tag_file)]) == {'custom': ['special']}
+
+        tag_file.write_text(yaml.dump({'custom': ['unique']}))
+        os.utime(tag_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert get_keywords([str(tag_file)], force_reload=True) == {'custom': ['unique']}
+
 
 class TestGetDefaultTagsFile:
     """Tests for default tags file path."""